@@ -4,10 +4,13 @@ import socket
 import threading
 import curses
 import sys
+import os
+import select
 import time
 import random
 import argparse
 import locale
+import bisect
 from collections import deque
 
 # Set locale for proper Unicode support
@@ -24,101 +27,215 @@ class TempestClient:
         self.server_version = None
         self.messages = deque(maxlen=100)
         self.running = True
+        self._receive_thread = None
         self.typing_users = set()  # Set of nicknames currently typing
-        self.last_keystroke = 0  # Timestamp of last keystroke
+        # Same nicknames kept sorted for display; replaced rather than mutated
+        # so the UI thread always reads a consistent snapshot
+        self.typing_users_sorted = []
+        self.messages_version = 0  # Bumped whenever messages changes
+        self.typing_version = 0  # Bumped whenever typing_users changes
+        self.last_keystroke = 0.0  # Monotonic timestamp of last keystroke
+        self.last_typing_sent_at = 0.0  # Monotonic timestamp of last /typing sent
         self.typing_sent = False  # Whether we've sent typing indicator
+        # Pre-encoded frames for the frequently sent typing notifications
+        self._typing_frame = b"/typing\n"
+        self._typing_stop_frame = b"/typing-stop\n"
+        # Serializes writes so frames from different threads never interleave
+        self._send_lock = threading.Lock()
+        # Server message handlers keyed by the first space-separated token
+        self._handlers = {
+            ">>>": self._on_server,
+            "---": self._on_activity,
+            "TYPING": self._on_typing,
+            "TYPING-STOP": self._on_typing_stop,
+        }
+        # Self-pipe used by the receive thread to wake the UI loop
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
         
     def connect(self):
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            # Enable TCP keepalive to prevent network timeouts
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            self.sock.connect((self.host, self.port))
+            self.sock = self._open_socket()
             self.connected = True
             # Start receiving thread
-            threading.Thread(target=self.receive_messages, daemon=True).start()
+            self._receive_thread = threading.Thread(target=self.receive_messages, daemon=True)
+            self._receive_thread.start()
             return True
         except Exception as e:
             self.messages.append(f"Connection failed: {e}")
+            self.messages_version += 1
             return False
     
+    def _open_socket(self):
+        """Connect to the first reachable address for host (IPv4 or IPv6)"""
+        last_error = None
+        for family, socktype, proto, _, sockaddr in socket.getaddrinfo(
+                self.host, self.port, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, socktype, proto)
+            try:
+                # Enable TCP keepalive to prevent network timeouts
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # Disable Nagle so keystroke-sized frames (e.g. /typing) go out immediately
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Larger kernel buffers for bursts of history and long pastes;
+                # set before connect() so the TCP window is negotiated with them
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                last_error = e
+                sock.close()
+        raise last_error or OSError(f"No addresses found for {self.host}")
+    
     def receive_messages(self):
-        buffer = ""
+        buffer = bytearray()
         while self.connected and self.running:
             try:
-                data = self.sock.recv(1024).decode('utf-8', errors='replace')
-                if not data:
+                chunk = self.sock.recv(65536)
+                if not chunk:
                     break
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line.strip():
-                        self.handle_server_message(line.strip())
-            except:
+                buffer.extend(chunk)
+                # Consume all complete lines in place, keeping the incomplete tail
+                end = buffer.rfind(b'\n')
+                if end == -1:
+                    continue
+                # Decode all complete lines in one call; the slice ends on a newline,
+                # so a multibyte character split across recv() calls stays buffered
+                complete = buffer[:end].decode('utf-8', errors='replace')
+                del buffer[:end + 1]
+                for line in complete.split('\n'):
+                    line = line.strip()
+                    if line:
+                        self.handle_server_message(line)
+                self.wake_ui()
+            except OSError:
                 break
         self.connected = False
+        self.wake_ui()
+    
+    def wake_ui(self):
+        """Wake the UI loop so it redraws without waiting for its timeout"""
+        if self._wake_w < 0:
+            return  # Already closed by disconnect()
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass  # Pipe full means a wake-up is already pending
+    
+    def drain_wakeups(self):
+        """Consume pending wake-up bytes"""
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except OSError:
+            pass
     
     def handle_server_message(self, msg):
-        if msg.startswith(">>> Welcome"):
+        # Dispatch on the leading token; anything unrecognized is chat
+        parts = msg.split(" ", 2)
+        handler = self._handlers.get(parts[0])
+        if handler is None or not handler(parts, msg):
+            # Regular chat messages
+            self.messages.append((msg, "chat"))
+            self.messages_version += 1
+    
+    def _on_server(self, parts, msg):
+        """Handle ">>> ..." server messages"""
+        if len(parts) < 2:
+            return False
+        if parts[1] == "Welcome":
             # Extract nickname and version from Welcome message
             # Format: ">>> Welcome nickname [avatar] (server vVERSION)"
-            parts = msg.split(" ")
-            if len(parts) >= 3:
-                self.nickname = parts[2]
+            words = msg.split(" ")
+            if len(words) >= 3:
+                self.nickname = words[2]
             # Extract version if present
-            for part in parts:
-                if part.startswith("v") and len(part) > 1:
-                    version_part = part[1:].rstrip(')')
+            for word in words:
+                if word.startswith("v") and len(word) > 1:
+                    version_part = word[1:].rstrip(')')
                     self.server_version = version_part.split('\n')[0]
                     break
-            self.messages.append((msg, "server"))
-        elif msg.startswith(">>> Entered room:"):
-            room = msg.split(">>> Entered room: ", 1)[1]
-            self.current_room = room
+        elif parts[1] == "Entered" and msg.startswith(">>> Entered room: "):
+            self.current_room = msg[len(">>> Entered room: "):]
             self.typing_users.clear()  # Clear typing users when changing rooms
-            self.messages.append((msg, "server"))
-        elif msg.startswith(">>>"):
-            # All other server messages
-            self.messages.append((msg, "server"))
-        elif msg.startswith("---") and msg.endswith("---"):
-            # Activity messages
-            self.messages.append((msg, "activity"))
-        elif msg.startswith("TYPING "):
-            # Extract nickname from TYPING message (format: "TYPING nickname [avatar]")
-            parts = msg.split(" ", 2)
-            if len(parts) >= 2:
-                nickname = parts[1]
-                self.typing_users.add(nickname)
-        elif msg.startswith("TYPING-STOP "):
-            # Extract nickname from TYPING-STOP message (format: "TYPING-STOP nickname")
-            parts = msg.split(" ", 1)
-            if len(parts) >= 2:
-                nickname = parts[1]
-                self.typing_users.discard(nickname)
-        else:
-            # Regular chat messages
-            self.messages.append((msg, "chat"))
+            self.typing_users_sorted = []
+            self.typing_version += 1
+        self.messages.append((msg, "server"))
+        self.messages_version += 1
+        return True
+    
+    def _on_activity(self, parts, msg):
+        """Handle "--- ... ---" activity messages"""
+        if not msg.endswith("---"):
+            return False
+        self.messages.append((msg, "activity"))
+        self.messages_version += 1
+        return True
+    
+    def _on_typing(self, parts, msg):
+        """Handle "TYPING nickname [avatar]" notifications"""
+        if len(parts) < 2:
+            return False
+        nickname = parts[1]
+        if nickname not in self.typing_users:
+            self.typing_users.add(nickname)
+            typing_sorted = self.typing_users_sorted[:]
+            bisect.insort(typing_sorted, nickname)
+            self.typing_users_sorted = typing_sorted
+            self.typing_version += 1
+        return True
+    
+    def _on_typing_stop(self, parts, msg):
+        """Handle "TYPING-STOP nickname" notifications"""
+        if len(parts) < 2:
+            return False
+        nickname = msg[len("TYPING-STOP "):]
+        if nickname in self.typing_users:
+            self.typing_users.discard(nickname)
+            self.typing_users_sorted = [n for n in self.typing_users_sorted if n != nickname]
+            self.typing_version += 1
+        return True
     
     def send_message(self, msg):
+        self._send_raw(f"{msg}\n".encode())
+    
+    def _send_raw(self, data):
         if self.connected:
             try:
-                self.sock.sendall(f"{msg}\n".encode())
-            except:
+                with self._send_lock:
+                    self.sock.sendall(data)
+            except OSError:
                 self.connected = False
     
     def disconnect(self):
         self.running = False
         # Send typing-stop if we were typing
         if self.typing_sent and self.connected:
-            self.send_message("/typing-stop")
+            self._send_raw(self._typing_stop_frame)
             self.typing_sent = False
         if self.sock:
+            try:
+                # Unblocks the receive thread's recv(); close() alone may not
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             self.sock.close()
+        # The receive thread writes to the wake-up pipe, so close it only once that thread is gone
+        if self._receive_thread is not None:
+            self._receive_thread.join(timeout=1.0)
+            if self._receive_thread.is_alive():
+                return
+        if self._wake_w >= 0:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
 
 def main_tui(stdscr, client):
     curses.curs_set(1)  # Show cursor
-    stdscr.nodelay(1)   # Non-blocking input
-    stdscr.timeout(50)  # Shorter timeout for responsiveness
+    stdscr.nodelay(1)   # Non-blocking input; waiting is done in select() below
+    curses.typeahead(-1)  # Don't poll stdin mid-update; flush each frame in one write
     
     # Initialize color pairs - use default terminal colors
     curses.start_color()
@@ -135,9 +252,15 @@ def main_tui(stdscr, client):
     input_win = None
     last_height, last_width = 0, 0
     input_buffer = ""
-    last_msg_count = 0
-    last_typing_users = set()
+    last_msg_version = -1
+    last_typing_version = -1
+    last_room_key = None
+    last_minute = -1
+    cached_time_str = ""
+    last_prompt_text = None
+    line_max = 1  # Usable line width, recomputed on resize
     needs_full_refresh = True
+    input_pending = True
     
     def safe_addstr(win, y, x, text, attr=0):
         """Safely add string to window, handling resize errors"""
@@ -146,43 +269,75 @@ def main_tui(stdscr, client):
         except curses.error:
             pass  # Ignore drawing errors (likely due to resize)
     
+    def place_window(win, rows, cols, y):
+        """Resize and move an existing window in place, creating it on first use"""
+        if win is None:
+            return curses.newwin(rows, cols, y, 0)
+        win.resize(rows, cols)
+        win.mvwin(y, 0)
+        win.erase()
+        return win
+    
     while client.running:
         try:
             # Get current terminal size
             height, width = stdscr.getmaxyx()
             
-            # Recreate windows if terminal was resized
+            # Lay out windows again if terminal was resized
             if height != last_height or width != last_width:
                 # Minimum size check
                 if height < 7 or width < 20:
                     stdscr.clear()
                     safe_addstr(stdscr, 0, 0, "Terminal too small!")
                     stdscr.refresh()
+                    # Wait for input; getch() is what lets curses pick up the new size
+                    select.select([sys.stdin], [], [], 0.5)
+                    stdscr.getch()
+                    last_height, last_width = 0, 0
                     continue
                     
-                # Recreate windows
+                # Stage a blank background first so the implicit stdscr
+                # refresh done by getch() never paints over the windows
+                stdscr.erase()
+                stdscr.noutrefresh()
+
+                # Resize existing windows rather than allocating new ones
                 try:
-                    room_win = curses.newwin(1, width, 0, 0)
-                    line_win = curses.newwin(1, width, 1, 0)
-                    msg_win = curses.newwin(height-5, width, 2, 0)
-                    typing_win = curses.newwin(1, width, height-3, 0)
-                    input_win = curses.newwin(2, width, height-2, 0)
+                    room_win = place_window(room_win, 1, width, 0)
+                    line_win = place_window(line_win, 1, width, 1)
+                    msg_win = place_window(msg_win, height-5, width, 2)
+                    typing_win = place_window(typing_win, 1, width, height-3)
+                    input_win = place_window(input_win, 2, width, height-2)
                     msg_win.scrollok(True)
                     last_height, last_width = height, width
                     needs_full_refresh = True
                 except curses.error:
                     continue  # Skip this iteration if window creation fails
+                
+                # Draw the static separators once per resize
+                line_max = max(1, width-1)
+                separator_text = "─" * line_max
+                safe_addstr(line_win, 0, 0, separator_text, curses.color_pair(1))
+                safe_addstr(input_win, 0, 0, separator_text, curses.color_pair(1))
+                line_win.noutrefresh()
             
             # Check if we need to update UI elements
-            msg_count = len(client.messages)
-            messages_changed = msg_count != last_msg_count
-            typing_changed = client.typing_users != last_typing_users
+            msg_version = client.messages_version
+            typing_version = client.typing_version
+            messages_changed = msg_version != last_msg_version
+            typing_changed = typing_version != last_typing_version
+            screen_changed = False
             
-            # Update room window (only every second to reduce flicker from time updates)
-            if room_win and (needs_full_refresh or int(time.time()) % 1 == 0):
-                room_win.clear()
+            # Update room window (only when the room, version or displayed minute changes)
+            minute = int(time.time()) // 60
+            if minute != last_minute:
+                cached_time_str = time.strftime("%I:%M %p")
+                last_minute = minute
+            current_time = cached_time_str
+            room_key = (client.current_room, client.server_version, current_time)
+            if room_win and (needs_full_refresh or room_key != last_room_key):
+                room_win.erase()
                 room_display = f"Room: {client.current_room or 'Not connected'}"
-                current_time = time.strftime("%I:%M %p")
                 version_info = f"v{client.server_version}" if client.server_version else ""
                 if version_info:
                     server_info = f"{client.host}:{client.port} {version_info} · {current_time}"
@@ -197,47 +352,45 @@ def main_tui(stdscr, client):
                 if width > len(server_info) + 2:
                     time_pos = width - len(server_info) - 1
                     safe_addstr(room_win, 0, time_pos, server_info, curses.color_pair(1))
-                room_win.refresh()
-            
-            # Add horizontal line under room (only on full refresh)
-            if line_win and needs_full_refresh:
-                line_win.clear()
-                line_text = "─" * max(1, width-1)
-                safe_addstr(line_win, 0, 0, line_text, curses.color_pair(1))
-                line_win.refresh()
+                room_win.noutrefresh()
+                last_room_key = room_key
+                screen_changed = True
             
             # Update message window (only when messages change)
             if msg_win and (messages_changed or needs_full_refresh):
-                msg_win.clear()
-                msg_lines = list(client.messages)
+                msg_win.erase()
+                # Index the visible tail from the right instead of copying the
+                # deque; iterating it could race with the receive thread
+                msgs = client.messages
                 msg_height = max(1, height-5)
-                start_line = max(0, len(msg_lines) - msg_height)
-                for i, msg_data in enumerate(msg_lines[start_line:]):
-                    if i < msg_height:
-                        # Handle both old string format and new tuple format
-                        if isinstance(msg_data, tuple):
-                            msg, msg_type = msg_data
-                            if msg_type == "server":
-                                color_pair = curses.color_pair(2)  # Cyan for server messages
-                            elif msg_type == "activity":
-                                color_pair = curses.color_pair(3)  # Yellow for activity messages
-                            else:
-                                color_pair = curses.color_pair(1)  # Default for chat messages
+                visible = min(len(msgs), msg_height)
+                for i in range(visible):
+                    msg_data = msgs[i - visible]
+                    # Handle both old string format and new tuple format
+                    if isinstance(msg_data, tuple):
+                        msg, msg_type = msg_data
+                        if msg_type == "server":
+                            color_pair = curses.color_pair(2)  # Cyan for server messages
+                        elif msg_type == "activity":
+                            color_pair = curses.color_pair(3)  # Yellow for activity messages
                         else:
-                            # Backward compatibility for old string format
-                            msg = msg_data
-                            color_pair = curses.color_pair(1)
-                        
-                        msg_text = msg[:max(1, width-1)]
-                        safe_addstr(msg_win, i, 0, msg_text, color_pair)
-                msg_win.refresh()
-                last_msg_count = msg_count
+                            color_pair = curses.color_pair(1)  # Default for chat messages
+                    else:
+                        # Backward compatibility for old string format
+                        msg = msg_data
+                        color_pair = curses.color_pair(1)
+                    
+                    msg_text = msg if len(msg) <= line_max else msg[:line_max]
+                    safe_addstr(msg_win, i, 0, msg_text, color_pair)
+                msg_win.noutrefresh()
+                last_msg_version = msg_version
+                screen_changed = True
             
             # Update typing indicator window (when typing users change)
             if typing_win and (typing_changed or needs_full_refresh):
-                typing_win.clear()
-                if client.typing_users:
-                    typing_list = sorted(list(client.typing_users))
+                typing_win.erase()
+                typing_list = client.typing_users_sorted
+                if typing_list:
                     if len(typing_list) == 1:
                         typing_text = f"◊ {typing_list[0]} is typing..."
                     elif len(typing_list) == 2:
@@ -246,21 +399,26 @@ def main_tui(stdscr, client):
                         typing_text = f"◊ {', '.join(typing_list[:-1])}, and {typing_list[-1]} are typing..."
                     
                     # Truncate if too long
-                    typing_display = typing_text[:max(1, width-1)]
+                    typing_display = typing_text if len(typing_text) <= line_max else typing_text[:line_max]
                     safe_addstr(typing_win, 0, 0, typing_display, curses.color_pair(1))
-                typing_win.refresh()
-                last_typing_users = client.typing_users.copy()
+                typing_win.noutrefresh()
+                last_typing_version = typing_version
+                screen_changed = True
             
-            # Always update input window to handle typing
-            if input_win:
-                input_win.clear()
-                line_text = "─" * max(1, width-1)
-                safe_addstr(input_win, 0, 0, line_text, curses.color_pair(1))
-                if client.nickname:
-                    prompt = f"{client.nickname}> {input_buffer}"
-                else:
-                    prompt = f"> {input_buffer}"
-                prompt_text = prompt[:max(1, width-1)]
+            # Update input window only when the prompt text changes
+            if client.nickname:
+                prompt = f"{client.nickname}> {input_buffer}"
+            else:
+                prompt = f"> {input_buffer}"
+            prompt_text = prompt if len(prompt) <= line_max else prompt[:line_max]
+            input_changed = prompt_text != last_prompt_text
+            if input_win and (input_changed or needs_full_refresh):
+                # Only the prompt row is rewritten; the separator above it is static
+                try:
+                    input_win.move(1, 0)
+                    input_win.clrtoeol()
+                except curses.error:
+                    pass
                 safe_addstr(input_win, 1, 0, prompt_text, curses.color_pair(1))
                 
                 # Position cursor at end of input
@@ -269,49 +427,69 @@ def main_tui(stdscr, client):
                     input_win.move(1, cursor_pos)
                 except curses.error:
                     pass
-                input_win.refresh()
+                last_prompt_text = prompt_text
+                screen_changed = True
+            
+            # Flush all pending window updates to the terminal in one pass.
+            # The input window goes last so the cursor ends up on the prompt.
+            if input_win and screen_changed:
+                input_win.noutrefresh()
+                curses.doupdate()
             
             needs_full_refresh = False
             
+            # Sleep until a keystroke, a wake-up from the receive thread or the
+            # clock tick. Skipped right after a key so curses' own typeahead
+            # buffer is drained before blocking again.
+            if not input_pending:
+                ready, _, _ = select.select([sys.stdin, client._wake_r], [], [], 0.5)
+                if client._wake_r in ready:
+                    client.drain_wakeups()
+            
             # Handle input
             try:
                 ch = stdscr.getch()
+                input_pending = ch != -1
                 if ch == -1:
                     # No input - check for typing timeout
-                    current_time = time.time()
-                    if client.typing_sent and current_time - client.last_keystroke > 2.0:
+                    now = time.monotonic()
+                    if client.typing_sent and now - client.last_keystroke > 2.0:
                         # User stopped typing, send typing-stop
                         if client.connected:
-                            client.send_message("/typing-stop")
+                            client._send_raw(client._typing_stop_frame)
                         client.typing_sent = False
                     continue
                 elif ch == 10 or ch == 13:  # Enter
                     if input_buffer.strip():
                         # Send typing-stop if we were typing
                         if client.typing_sent and client.connected:
-                            client.send_message("/typing-stop")
+                            client._send_raw(client._typing_stop_frame)
                         client.typing_sent = False
                         # Send the actual message
                         client.send_message(input_buffer.strip())
                         input_buffer = ""
                 elif ch == 127 or ch == 8:  # Backspace
                     input_buffer = input_buffer[:-1]
-                    # Track keystroke for typing indicator
-                    if not client.typing_sent and client.connected:
-                        current_time = time.time()
-                        client.last_keystroke = current_time
-                        client.send_message("/typing")
+                    # Track keystroke for typing indicator; while typing continues,
+                    # resend /typing every 2s so the server's 3s expiry never fires
+                    now = time.monotonic()
+                    client.last_keystroke = now
+                    if client.connected and (not client.typing_sent or now - client.last_typing_sent_at > 2.0):
+                        client._send_raw(client._typing_frame)
                         client.typing_sent = True
+                        client.last_typing_sent_at = now
                 elif ch == 27:  # Escape
                     break
                 elif 32 <= ch <= 126:  # Printable characters
                     input_buffer += chr(ch)
-                    # Track keystroke for typing indicator
-                    if not client.typing_sent and client.connected:
-                        current_time = time.time()
-                        client.last_keystroke = current_time
-                        client.send_message("/typing")
+                    # Track keystroke for typing indicator; while typing continues,
+                    # resend /typing every 2s so the server's 3s expiry never fires
+                    now = time.monotonic()
+                    client.last_keystroke = now
+                    if client.connected and (not client.typing_sent or now - client.last_typing_sent_at > 2.0):
+                        client._send_raw(client._typing_frame)
                         client.typing_sent = True
+                        client.last_typing_sent_at = now
             except KeyboardInterrupt:
                 break
         except curses.error:
@@ -338,12 +516,8 @@ def connection_animation():
         print(f"\r{frame}", end="", flush=True)
         
         # Show progress bar for each step
-        progress = ""
-        for j in range(20):
-            if j < (i + 1) * 20 // len(frames):
-                progress += random.choice(progress_chars)
-            else:
-                progress += "░"
+        filled = (i + 1) * 20 // len(frames)
+        progress = "".join(random.choices(progress_chars, k=filled)) + "░" * (20 - filled)
         
         print(f"\n[{progress}] {((i + 1) * 100) // len(frames)}%", end="")
         
@@ -361,19 +535,25 @@ def main():
     parser = argparse.ArgumentParser(description='Tempest Chat Client')
     parser.add_argument('server', nargs='?', default='localhost:1991',
                        help='Server address (host:port)')
+    parser.add_argument('--retro', action='store_true',
+                       help='Show the retro connection animation')
     args = parser.parse_args()
     
-    if ':' in args.server:
-        host, port = args.server.rsplit(':', 1)
-        port = int(port)
+    host, sep, port = args.server.rpartition(':')
+    if not sep or (':' in host and not host.endswith(']')):
+        # No port given (a bare IPv6 address also ends up here)
+        host, port = args.server, 1991
     else:
-        host = args.server
-        port = 1991
+        port = int(port)
+    host = host.strip('[]')  # Allow [::1]:1991 style IPv6 addresses
     
     client = TempestClient(host, port)
     
     print(f"Connecting to {host}:{port}...")
     
+    if args.retro:
+        connection_animation()
+    
     # Attempt actual connection
     if not client.connect():
         print("CONNECTION FAILED")
@@ -382,6 +562,9 @@ def main():
     
     print("Connected successfully!")
     
+    # Shorten the Escape key delay; must be set before curses initializes
+    os.environ.setdefault('ESCDELAY', '25')
+    
     try:
         curses.wrapper(main_tui, client)
     except KeyboardInterrupt:
@@ -5,16 +5,21 @@
 # - Maintain message history per room (in-memory for now)
 
 import socket
-import threading
+import logging
+import queue
+import selectors
 import random
 import time
 import re
-import html
 import os
 import signal
 import subprocess
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+import sys
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from itertools import islice
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Set, Tuple, Optional
 
 def get_version():
     """Get server version from git commit hash"""
@@ -65,6 +70,9 @@ ASCII_AVATARS = [
     '◆', '◇', '○', '●', '□', '■', '△', '▲', '▽', '▼',
     '◈', '◉', '◎', '⬟', '⬢', '⬡'
 ]
+AVATAR_COUNT = len(ASCII_AVATARS)
+# Dedicated generator; 16 random bits keep the modulo bias below 0.1% for 42 avatars
+AVATAR_BITS = random.Random().getrandbits
 
 # Security configuration
 MAX_CLIENTS = 100
@@ -73,121 +81,181 @@ MAX_NICKNAME_LENGTH = 30
 MAX_ROOM_NAME_LENGTH = 50
 MAX_MESSAGE_LENGTH = 500
 MAX_MESSAGES_PER_ROOM = 100
+MAX_LINE_BYTES = 4 * MAX_MESSAGE_LENGTH  # Longest UTF-8 encoding of a valid line
+RECV_SIZE = 8192
+MAX_OUTBUF_BYTES = 1 << 20  # Unsent output allowed per client before it is dropped as too slow
+ACCEPT_BATCH = 16  # Connections accepted per loop wakeup; the rest wait in the backlog
 CONNECTION_TIMEOUT = 60 * 60  # 1 hour
 
-@dataclass
+# Input validation
+NICKNAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_\.\[\]\(\)]+$')
+ROOM_NAME_PATTERN = re.compile(r'^[#a-zA-Z0-9\s\-_\.]+$')
+CONTROL_CHAR_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+HELP_TEXT = """Available commands:
+/connect <name> - Set your nickname and connect to the server
+/room <name>    - Join or create a chat room
+/who            - List users in your current room
+/help           - Show this help message
+/bye            - Disconnect from the server
+
+After connecting and joining a room, simply type messages to chat!"""
+
+# Static responses, encoded once
+WELCOME_BYTES = b">>> Welcome to Tempest Server! Use /connect <name> to begin.\n"
+SERVER_FULL_BYTES = b"Server full. Please try again later.\n"
+HELP_BYTES = f"{HELP_TEXT}\n".encode()
+GOODBYE_BYTES = b">>> Goodbye!\n"
+MUST_CONNECT_BYTES = b"You must /connect first.\n"
+MUST_JOIN_ROOM_BYTES = b"You must join a room first.\n"
+MUST_ROOM_BYTES = b"You must /room <name> first.\n"
+CONNECT_USAGE_BYTES = b"Error: /connect requires a nickname\n"
+NICKNAME_IN_USE_BYTES = b"Error: Nickname already in use\n"
+ROOM_USAGE_BYTES = b"Error: /room requires a room name\n"
+ROOM_LIMIT_BYTES = f"Error: Server room limit reached ({MAX_ROOMS} rooms)\n".encode()
+MESSAGE_TOO_LONG_BYTES = f"Error: Message too long (max {MAX_MESSAGE_LENGTH} characters)\n".encode()
+UNKNOWN_CMD_BYTES = b"Unknown command. Type /help for available commands.\n"
+ROOMS_HDR_BYTES = b">>> Active rooms:\n"
+NO_ROOMS_BYTES = b">>> No active rooms. Use /room <name> to create one.\n"
+RATE_LIMIT_BYTES = b"Rate limit exceeded. Please slow down.\n"
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them (3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_OPTIONS)
 class ClientInfo:
     nickname: str
     room: Optional[str]
     avatar: str
+    display_prefix: str = field(init=False)  # "[avatar] nickname", formatted once
+
+    def __post_init__(self):
+        self.display_prefix = f"[{self.avatar}] {self.nickname}"
+
+class Room:
+    """Per-room state: members (an insertion-ordered set) and bounded message history"""
+    __slots__ = ('members', 'history')
+
+    def __init__(self):
+        self.members: Dict[socket.socket, None] = {}
+        self.history: Deque[str] = deque(maxlen=MAX_MESSAGES_PER_ROOM)
+
+@dataclass(**DATACLASS_OPTIONS)
+class ClientConnection:
+    addr: Tuple[str, int]
+    buffer: bytearray = field(default_factory=bytearray)  # Partial line awaiting a newline
+    overflow: bool = False  # Discarding the rest of an over-long line
+    outbuf: bytearray = field(default_factory=bytearray)  # Output the socket could not take yet
+    closing: bool = False  # Queued for teardown
 
 class CommandHandler:
     def __init__(self, server_state):
         self.server_state = server_state
     
-    def handle_connect(self, conn: socket.socket, args: str) -> Tuple[bool, str]:
+    def handle_connect(self, conn: socket.socket, args: str) -> Tuple[bool, bytes]:
         """Handle /connect command"""
         if not args.strip():
-            return False, "Error: /connect requires a nickname\n"
+            return False, CONNECT_USAGE_BYTES
         
         raw_nickname = args.strip()
         valid, result = validate_nickname(raw_nickname)
         if not valid:
-            return False, f"Error: {result}\n"
+            return False, f"Error: {result}\n".encode()
         
         nickname = sanitize_input(result)
         
-        # Check for duplicate nicknames
-        existing_nicks = [client.nickname.lower() for client in self.server_state.clients.values() if conn != conn]
-        if nickname.lower() in existing_nicks:
-            return False, "Error: Nickname already in use\n"
+        # Check for duplicate nicknames (a client may re-use its own)
+        nick_key = nickname.lower()
+        current = self.server_state.clients.get(conn)
+        current_key = current.nickname.lower() if current else None
+        if nick_key in self.server_state.nicks_lower and nick_key != current_key:
+            return False, NICKNAME_IN_USE_BYTES
+        self.server_state.nicks_lower.discard(current_key)
+        self.server_state.nicks_lower.add(nick_key)
         
-        avatar = random.choice(ASCII_AVATARS)
-        self.server_state.clients[conn] = ClientInfo(nickname, None, avatar)
-        print(f"[CONNECT] Client connected as '{nickname}' with avatar [{avatar}]")
+        avatar = ASCII_AVATARS[AVATAR_BITS(16) % AVATAR_COUNT]
+        # Re-connecting keeps the room the connection is still a member of, so cleanup can leave it
+        room = current.room if current else None
+        self.server_state.clients[conn] = ClientInfo(nickname, room, avatar)
+        log.info(f"[CONNECT] Client connected as '{nickname}' with avatar [{avatar}]")
         
-        return True, f">>> Welcome {nickname} [{avatar}] (server v{SERVER_VERSION})\n"
+        return True, f">>> Welcome {nickname} [{avatar}] (server v{SERVER_VERSION})\n".encode()
     
-    def handle_room(self, conn: socket.socket, args: str) -> Tuple[bool, str]:
+    def handle_room(self, conn: socket.socket, args: str) -> Tuple[bool, bytes]:
         """Handle /room command"""
-        if conn not in self.server_state.clients:
-            return False, "You must /connect first.\n"
+        client_info = self.server_state.clients.get(conn)
+        if client_info is None:
+            return False, MUST_CONNECT_BYTES
         
-        if len(self.server_state.rooms) >= MAX_ROOMS:
-            return False, f"Error: Server room limit reached ({MAX_ROOMS} rooms)\n"
+        rooms = self.server_state.rooms
+        if len(rooms) >= MAX_ROOMS:
+            return False, ROOM_LIMIT_BYTES
         
         if not args.strip():
-            return False, "Error: /room requires a room name\n"
+            return False, ROOM_USAGE_BYTES
         
         raw_room = args.strip()
         valid, result = validate_room_name(raw_room)
         if not valid:
-            return False, f"Error: {result}\n"
+            return False, f"Error: {result}\n".encode()
         
         new_room = sanitize_input(result)
-        client_info = self.server_state.clients[conn]
         
         # Leave current room
-        if client_info.room and conn in self.server_state.rooms.get(client_info.room, []):
-            self.server_state.rooms[client_info.room].remove(conn)
-            if not self.server_state.rooms[client_info.room]:
-                del self.server_state.rooms[client_info.room]
-                if client_info.room in self.server_state.messages:
-                    del self.server_state.messages[client_info.room]
+        old_room = rooms.get(client_info.room)
+        if old_room is not None and conn in old_room.members:
+            del old_room.members[conn]
+            if not old_room.members:
+                del rooms[client_info.room]
         
         # Join new room
         client_info.room = new_room
-        self.server_state.rooms.setdefault(new_room, []).append(conn)
-        self.server_state.messages.setdefault(new_room, [])
+        room = rooms.get(new_room)
+        if room is None:
+            room = rooms[new_room] = Room()
+        room.members[conn] = None
         
-        print(f"[ROOM] {client_info.nickname} [{client_info.avatar}] joined room '{new_room}'")
-        return True, f">>> Entered room: {new_room}\n"
+        log.info(f"[ROOM] {client_info.nickname} [{client_info.avatar}] joined room '{new_room}'")
+        return True, f">>> Entered room: {new_room}\n".encode()
     
-    def handle_who(self, conn: socket.socket) -> Tuple[bool, str]:
+    def handle_who(self, conn: socket.socket) -> Tuple[bool, bytes]:
         """Handle /who command"""
-        if conn not in self.server_state.clients:
-            return False, "You must /connect first.\n"
+        clients = self.server_state.clients
+        client_info = clients.get(conn)
+        if client_info is None:
+            return False, MUST_CONNECT_BYTES
         
-        client_info = self.server_state.clients[conn]
         if not client_info.room:
-            return False, "You must join a room first.\n"
+            return False, MUST_JOIN_ROOM_BYTES
         
         user_list = []
-        for c in self.server_state.rooms.get(client_info.room, []):
-            if c in self.server_state.clients:
-                other_client = self.server_state.clients[c] 
-                user_list.append(f"[{other_client.avatar}] {other_client.nickname}")
+        for c in self.server_state.room_members(client_info.room):
+            other_client = clients.get(c)
+            if other_client is not None:
+                user_list.append(other_client.display_prefix)
         
-        print(f"[WHO] {client_info.nickname} requested user list for room '{client_info.room}': {user_list}")
-        return True, f">>> Users in room: {', '.join(user_list)}\n"
+        log.info(f"[WHO] {client_info.nickname} requested user list for room '{client_info.room}': {user_list}")
+        return True, f">>> Users in room: {', '.join(user_list)}\n".encode()
     
-    def handle_help(self) -> Tuple[bool, str]:
+    def handle_help(self) -> Tuple[bool, bytes]:
         """Handle /help command"""
-        help_text = """Available commands:
-/connect <name> - Set your nickname and connect to the server
-/room <name>    - Join or create a chat room
-/who            - List users in your current room
-/help           - Show this help message
-/bye            - Disconnect from the server
-
-After connecting and joining a room, simply type messages to chat!"""
-        return True, f"{help_text}\n"
+        return True, HELP_BYTES
     
-    def handle_bye(self, conn: socket.socket) -> Tuple[bool, str]:
+    def handle_bye(self, conn: socket.socket) -> Tuple[bool, bytes]:
         """Handle /bye command"""
-        if conn in self.server_state.clients:
-            client_info = self.server_state.clients[conn]
-            print(f"[DISCONNECT] {client_info.nickname} [{client_info.avatar}] disconnected gracefully")
-        return True, ">>> Goodbye!\n"
+        client_info = self.server_state.clients.get(conn)
+        if client_info is not None:
+            log.info(f"[DISCONNECT] {client_info.nickname} [{client_info.avatar}] disconnected gracefully")
+        return True, GOODBYE_BYTES
     
-    def handle_typing(self, conn: socket.socket) -> Tuple[bool, str]:
+    def handle_typing(self, conn: socket.socket) -> Tuple[bool, bytes]:
         """Handle /typing command"""
-        if conn not in self.server_state.clients:
-            return True, ""  # Silently ignore if not connected
+        client_info = self.server_state.clients.get(conn)
+        if client_info is None:
+            return True, b""  # Silently ignore if not connected
         
-        client_info = self.server_state.clients[conn]
         if not client_info.room:
-            return True, ""  # Silently ignore if not in room
+            return True, b""  # Silently ignore if not in room
         
         # Update typing status
         current_time = time.time()
@@ -197,189 +265,168 @@ After connecting and joining a room, simply type messages to chat!"""
         if conn not in room_typing:
             room_typing[conn] = current_time
             # Broadcast to others in room
-            for other_conn in self.server_state.rooms.get(client_info.room, []):
+            payload = f"TYPING {client_info.nickname} [{client_info.avatar}]\n".encode()
+            for other_conn in self.server_state.room_members(client_info.room):
                 if other_conn != conn:
-                    try:
-                        other_conn.sendall(f"TYPING {client_info.nickname} [{client_info.avatar}]\n".encode())
-                    except:
-                        pass
+                    send_to(other_conn, payload)
         else:
             # Update timestamp
             room_typing[conn] = current_time
         
-        return True, ""
+        return True, b""
     
-    def handle_typing_stop(self, conn: socket.socket) -> Tuple[bool, str]:
+    def handle_typing_stop(self, conn: socket.socket) -> Tuple[bool, bytes]:
         """Handle /typing-stop command"""
-        if conn not in self.server_state.clients:
-            return True, ""  # Silently ignore if not connected
+        client_info = self.server_state.clients.get(conn)
+        if client_info is None:
+            return True, b""  # Silently ignore if not connected
         
-        client_info = self.server_state.clients[conn]
         if not client_info.room:
-            return True, ""  # Silently ignore if not in room
+            return True, b""  # Silently ignore if not in room
         
         # Remove typing status
         room_typing = self.server_state.typing_users.get(client_info.room, {})
         if conn in room_typing:
             del room_typing[conn]
             # Broadcast to others in room
-            for other_conn in self.server_state.rooms.get(client_info.room, []):
+            payload = f"TYPING-STOP {client_info.nickname}\n".encode()
+            for other_conn in self.server_state.room_members(client_info.room):
                 if other_conn != conn:
-                    try:
-                        other_conn.sendall(f"TYPING-STOP {client_info.nickname}\n".encode())
-                    except:
-                        pass
+                    send_to(other_conn, payload)
         
-        return True, ""
+        return True, b""
 
 class MessageProcessor:
     def __init__(self, server_state, command_handler):
         self.server_state = server_state
         self.command_handler = command_handler
+        # Command name -> handler(conn, args), returning True to continue
+        self.dispatch = {
+            "/connect": self._do_connect,
+            "/room": self._do_room,
+            "/who": self._do_who,
+            "/help": self._do_help,
+            "/bye": self._do_bye,
+            "/typing": self._do_typing,
+            "/typing-stop": self._do_typing_stop,
+        }
     
     def process_line(self, conn: socket.socket, line: str, addr) -> bool:
         """Process a line of input from client. Returns True to continue, False to disconnect."""
         if line.startswith("/") and not line.startswith("/typing"):
-            print(f"[DEBUG] Processing command: '{line}' from {addr}")
+            log.info(f"[DEBUG] Processing command: '{line}' from {addr}")
         
         if len(line) > MAX_MESSAGE_LENGTH:
-            try:
-                conn.sendall(f"Error: Message too long (max {MAX_MESSAGE_LENGTH} characters)\n".encode())
-            except:
-                pass
+            send_to(conn, MESSAGE_TOO_LONG_BYTES)
             return True
         
-        # Handle commands
-        if line.startswith("/connect"):
-            success, response = self.command_handler.handle_connect(conn, line[8:].strip())
-            try:
-                conn.sendall(response.encode())
-            except:
-                return False
-            
-            if success:
-                # Send room list with users
-                self._send_room_list(conn)
-            return True
-            
-        elif line.startswith("/room"):
-            success, response = self.command_handler.handle_room(conn, line[5:].strip())
-            try:
-                conn.sendall(response.encode())
-            except:
-                return False
-            
-            if success and conn in self.server_state.clients:
-                client_info = self.server_state.clients[conn]
-                # Send last 10 messages
-                room_messages = self.server_state.messages.get(client_info.room, [])
-                for msg in room_messages[-10:]:
-                    try:
-                        conn.sendall(f"{msg}\n".encode())
-                    except:
-                        return False
-                # Broadcast join message
-                broadcast(client_info.room, f"--- [{client_info.avatar}] {client_info.nickname} has entered the room ---")
-            return True
-            
-        elif line.startswith("/who"):
-            success, response = self.command_handler.handle_who(conn)
-            try:
-                conn.sendall(response.encode())
-            except:
-                return False
-            return True
-            
-        elif line.startswith("/help"):
-            success, response = self.command_handler.handle_help()
-            try:
-                conn.sendall(response.encode())
-            except:
-                return False
-            return True
-            
-        elif line.startswith("/bye"):
-            success, response = self.command_handler.handle_bye(conn)
-            try:
-                conn.sendall(response.encode())
-            except:
-                pass
-            return False  # Disconnect
-            
-        elif line.startswith("/typing-stop"):
-            success, response = self.command_handler.handle_typing_stop(conn)
-            if response:
-                try:
-                    conn.sendall(response.encode())
-                except:
-                    return False
-            return True
-            
-        elif line.startswith("/typing"):
-            success, response = self.command_handler.handle_typing(conn)
-            if response:
-                try:
-                    conn.sendall(response.encode())
-                except:
+        # Handle commands with a single table lookup; regular messages skip it entirely
+        if line.startswith("/"):
+            cmd, _, args = line.partition(" ")
+            handler = self.dispatch.get(cmd)
+            if handler is None:
+                log.info(f"[DEBUG] Unknown command received: '{line}' from {addr}")
+                if not send_to(conn, UNKNOWN_CMD_BYTES):
                     return False
-            return True
-            
-        elif line.startswith("/"):
-            print(f"[DEBUG] Unknown command received: '{line}' from {conn.getpeername()}")
-            try:
-                conn.sendall("Unknown command. Type /help for available commands.\n".encode())
-            except:
+                return True
+            return handler(conn, args)
+        
+        # Handle regular message
+        return self._handle_regular_message(conn, line)
+    
+    def _do_connect(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_connect(conn, args.strip())
+        buf = bytearray(response)
+        if success:
+            # Send room list with users in the same write
+            self._append_room_list(buf)
+        if not send_to(conn, buf):
+            return False
+        return True
+    
+    def _do_room(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_room(conn, args.strip())
+        client_info = self.server_state.clients.get(conn) if success else None
+        joined = client_info is not None
+        buf = bytearray(response)
+        if joined:
+            # Send last 10 messages along with the response
+            room_messages = self.server_state.rooms[client_info.room].history
+            for msg in islice(room_messages, max(0, len(room_messages) - 10), None):
+                buf += msg.encode()
+                buf += b"\n"
+        if not send_to(conn, buf):
+            return False
+        
+        if joined:
+            # Broadcast join message
+            broadcast(client_info.room, f"--- {client_info.display_prefix} has entered the room ---")
+        return True
+    
+    def _do_who(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_who(conn)
+        if not send_to(conn, response):
+            return False
+        return True
+    
+    def _do_help(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_help()
+        if not send_to(conn, response):
+            return False
+        return True
+    
+    def _do_bye(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_bye(conn)
+        send_to(conn, response)
+        return False  # Disconnect
+    
+    def _do_typing(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_typing(conn)
+        if response:
+            if not send_to(conn, response):
                 return False
-            return True
-            
-        else:
-            # Handle regular message
-            return self._handle_regular_message(conn, line)
-    
-    def _send_room_list(self, conn: socket.socket):
-        """Send list of active rooms to client"""
-        room_info = []
-        for room_name, room_clients in self.server_state.rooms.items():
-            if room_clients:  # Only show rooms with users
-                users = []
-                for c in room_clients:
-                    if c in self.server_state.clients:
-                        client = self.server_state.clients[c]
-                        users.append(f"[{client.avatar}] {client.nickname}")
-                room_info.append(f"{room_name}: {', '.join(users)}")
+        return True
+    
+    def _do_typing_stop(self, conn: socket.socket, args: str) -> bool:
+        success, response = self.command_handler.handle_typing_stop(conn)
+        if response:
+            if not send_to(conn, response):
+                return False
+        return True
+    
+    def _append_room_list(self, buf: bytearray):
+        """Append list of active rooms to an outgoing buffer"""
+        clients = self.server_state.clients
+        lines = []
+        for room_name, room in self.server_state.rooms.items():
+            if room.members:  # Only show rooms with users
+                users = ', '.join(client.display_prefix
+                                  for client in map(clients.get, room.members) if client is not None)
+                lines.append(f"  {room_name}: {users}\n")
         
-        try:
-            if room_info:
-                conn.sendall(">>> Active rooms:\n".encode())
-                for info in room_info:
-                    conn.sendall(f"  {info}\n".encode())
-            else:
-                conn.sendall(">>> No active rooms. Use /room <name> to create one.\n".encode())
-        except:
-            pass
+        if lines:
+            buf += ROOMS_HDR_BYTES
+            buf += "".join(lines).encode()  # One encode for the whole list
+        else:
+            buf += NO_ROOMS_BYTES
     
     def _handle_regular_message(self, conn: socket.socket, line: str) -> bool:
         """Handle regular chat message"""
-        if conn not in self.server_state.clients:
-            try:
-                conn.sendall("You must /connect first.\n".encode())
-            except:
+        client_info = self.server_state.clients.get(conn)
+        if client_info is None:
+            if not send_to(conn, MUST_CONNECT_BYTES):
                 return False
             return True
             
-        client_info = self.server_state.clients[conn]
-        if not client_info.room:
-            try:
-                conn.sendall("You must /room <name> first.\n".encode())
-            except:
+        room_name = client_info.room
+        if not room_name:
+            if not send_to(conn, MUST_ROOM_BYTES):
                 return False
             return True
         
         # Check rate limit for messages
         if not check_rate_limit(conn):
-            try:
-                conn.sendall("Rate limit exceeded. Please slow down.\n".encode())
-            except:
+            if not send_to(conn, RATE_LIMIT_BYTES):
                 return False
             return True
         
@@ -389,40 +436,61 @@ class MessageProcessor:
             return True  # Skip empty messages
         
         # Clear typing status when sending a message
-        room_typing = self.server_state.typing_users.get(client_info.room, {})
+        room = self.server_state.rooms.get(room_name)
+        room_typing = self.server_state.typing_users.get(room_name, {})
         if conn in room_typing:
             del room_typing[conn]
             # Broadcast typing stop to others in room
-            for other_conn in self.server_state.rooms.get(client_info.room, []):
-                if other_conn != conn:
-                    try:
-                        other_conn.sendall(f"TYPING-STOP {client_info.nickname}\n".encode())
-                    except:
-                        pass
-        
-        msg = f"[{client_info.avatar}] {client_info.nickname}: {message_content}"
-        print(f"[MESSAGE] Room '{client_info.room}' - {client_info.nickname} [{client_info.avatar}]: {message_content}")
+            if room is not None:
+                payload = f"TYPING-STOP {client_info.nickname}\n".encode()
+                for other_conn in room.members:
+                    if other_conn != conn:
+                        send_to(other_conn, payload)
         
-        # Add to message history
-        room_messages = self.server_state.messages.setdefault(client_info.room, [])
-        room_messages.append(msg)
+        msg = f"{client_info.display_prefix}: {message_content}"
+        log.info(f"[MESSAGE] Room '{room_name}' - {client_info.nickname} [{client_info.avatar}]: {message_content}")
         
-        # Limit message history per room
-        if len(room_messages) > MAX_MESSAGES_PER_ROOM:
-            self.server_state.messages[client_info.room] = room_messages[-MAX_MESSAGES_PER_ROOM:]
+        # Add to message history (the deque evicts the oldest entry past MAX_MESSAGES_PER_ROOM)
+        if room is not None:
+            room.history.append(msg)
         
         # Broadcast message
-        broadcast(client_info.room, msg)
+        broadcast(room_name, msg)
         return True
 
 class ServerState:
+    __slots__ = ('clients', 'nicks_lower', 'rooms', 'rate_limits', 'typing_users',
+                 'active_connections', 'connections', 'closing', 'pending_output', 'selector')
+
     def __init__(self):
         self.clients: Dict[socket.socket, ClientInfo] = {}
-        self.rooms: Dict[str, List[socket.socket]] = {}
-        self.messages: Dict[str, List[str]] = {}
-        self.rate_limits: Dict[socket.socket, Tuple[float, int]] = {}
+        self.nicks_lower: Set[str] = set()  # lowercased nicknames of connected clients
+        self.rooms: Dict[str, Room] = {}
+        self.rate_limits: Dict[socket.socket, List[float]] = {}  # conn -> [tokens, last monotonic time]
         self.typing_users: Dict[str, Dict[socket.socket, float]] = {}  # room -> {conn: timestamp}
         self.active_connections = 0
+        self.connections: Dict[socket.socket, ClientConnection] = {}  # Every registered client socket
+        self.closing: List[socket.socket] = []  # Clients to tear down once the current event is handled
+        self.pending_output: Dict[socket.socket, ClientConnection] = {}  # Clients with output queued this pass
+        self.selector: Optional[selectors.BaseSelector] = None
+
+    def room_members(self, room_name):
+        """Members of a room, or an empty tuple if the room does not exist"""
+        room = self.rooms.get(room_name)
+        return room.members if room is not None else ()
+
+# Logging: the event loop only enqueues records; a background thread writes them out
+LOG_QUEUE = queue.SimpleQueue()
+log = logging.getLogger('tempest')
+log.addHandler(QueueHandler(LOG_QUEUE))
+log.setLevel(logging.INFO)
+log.propagate = False
+
+def start_log_listener():
+    """Start the thread that writes queued log records to stdout (per process, threads don't survive fork)"""
+    listener = QueueListener(LOG_QUEUE, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
 
 # Global server state
 server_state = ServerState()
@@ -433,10 +501,8 @@ def sanitize_input(text):
     """Sanitize user input to prevent injection attacks"""
     if not text:
         return ""
-    # Remove control characters except newline and tab
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-    # HTML escape to prevent XSS-like attacks
-    sanitized = html.escape(sanitized)
+    # Remove control characters except newline and tab (printable text has none)
+    sanitized = text if text.isprintable() else CONTROL_CHAR_PATTERN.sub('', text)
     return sanitized.strip()
 
 def validate_nickname(nickname):
@@ -449,7 +515,7 @@ def validate_nickname(nickname):
         return False, f"Nickname too long (max {MAX_NICKNAME_LENGTH} characters)"
     
     # Check for valid characters (alphanumeric, spaces, basic punctuation)
-    if not re.match(r'^[a-zA-Z0-9\s\-_\.\[\]\(\)]+$', nickname):
+    if not NICKNAME_PATTERN.match(nickname):
         return False, "Nickname contains invalid characters"
     
     return True, nickname[:MAX_NICKNAME_LENGTH]
@@ -464,134 +530,282 @@ def validate_room_name(room_name):
         return False, f"Room name too long (max {MAX_ROOM_NAME_LENGTH} characters)"
     
     # Allow # prefix and basic characters
-    if not re.match(r'^[#a-zA-Z0-9\s\-_\.]+$', room_name):
+    if not ROOM_NAME_PATTERN.match(room_name):
         return False, "Room name contains invalid characters"
     
     return True, room_name[:MAX_ROOM_NAME_LENGTH]
 
 def check_rate_limit(conn, max_messages=20, window_seconds=60):
-    """Check if connection exceeds rate limit"""
-    now = time.time()
-    
-    if conn not in server_state.rate_limits:
-        server_state.rate_limits[conn] = (now, 1)
-        return True
-    
-    last_time, count = server_state.rate_limits[conn]
-    
-    # Reset counter if window has passed
-    if now - last_time >= window_seconds:
-        server_state.rate_limits[conn] = (now, 1)
-        return True
-    
-    # Check if under limit
-    if count < max_messages:
-        server_state.rate_limits[conn] = (last_time, count + 1)
+    """Check if connection exceeds rate limit (token bucket refilled at max_messages per window)"""
+    now = time.monotonic()
+    state = server_state.rate_limits.get(conn)
+    if state is None:
+        server_state.rate_limits[conn] = [max_messages - 1, now]
         return True
     
-    # Rate limited
-    return False
+    # Refill tokens for the time elapsed, capped at a full bucket; state is updated in place
+    tokens = state[0] + (now - state[1]) * (max_messages / window_seconds)
+    state[1] = now
+    if tokens > max_messages:
+        tokens = max_messages
+    if tokens < 1:
+        state[0] = tokens
+        return False  # Rate limited
+    state[0] = tokens - 1
+    return True
 
 def broadcast(room, msg):
-    if room in server_state.rooms:
-        print(f"[BROADCAST] Room '{room}': {msg}")
-        for conn in server_state.rooms[room][:]:  # Copy list to avoid modification during iteration
-            try:
-                conn.sendall(f"{msg}\n".encode())
-            except Exception as e:
-                print(f"[ERROR] Broadcast error to client: {e}")
-                # Remove broken connection
-                server_state.rooms[room].remove(conn)
-                if conn in server_state.clients:
-                    del server_state.clients[conn]
-
-def handle_client(conn, addr):
-    nickname = None
-    room = None
+    room_state = server_state.rooms.get(room)
+    if room_state is not None:
+        log.info(f"[BROADCAST] Room '{room}': {msg}")
+        payload = f"{msg}\n".encode()  # Encoded once for all recipients
+        # A failed or backed-up recipient is queued for teardown, not removed mid-iteration
+        gone = []
+        for conn in room_state.members:
+            if not send_to(conn, payload) and conn not in server_state.connections:
+                gone.append(conn)
+        # Members whose connection no longer exists would otherwise keep the room alive forever
+        for conn in gone:
+            del room_state.members[conn]
+        if not room_state.members:
+            del server_state.rooms[room]
+            server_state.typing_users.pop(room, None)
+
+def send_to(conn, data):
+    """Queue output for a client; it is sent by flush_pending_output. Returns False if the client is being dropped."""
+    connection = server_state.connections.get(conn)
+    if connection is None or connection.closing:
+        return False
+    outbuf = connection.outbuf
+    if not outbuf:
+        # A non-empty buffer is already pending or waiting for EVENT_WRITE
+        server_state.pending_output[conn] = connection
+    outbuf += data
+    if len(outbuf) > MAX_OUTBUF_BYTES:
+        log.info(f"[SLOW] Dropping {connection.addr}: {len(outbuf)} bytes unsent")
+        close_later(conn, connection)
+        return False
+    return True
+
+def flush_pending_output():
+    """Send output queued during this loop pass: one send per client, however many frames it holds"""
+    pending = server_state.pending_output
+    for conn, connection in pending.items():
+        if connection.closing:
+            continue
+        outbuf = connection.outbuf
+        try:
+            sent = conn.send(outbuf)
+        except BlockingIOError:
+            sent = 0
+        except OSError as e:
+            log.error(f"[ERROR] Send error to {connection.addr}: {e}")
+            close_later(conn, connection)
+            continue
+        del outbuf[:sent]
+        if outbuf:
+            # Socket buffer is full: keep the rest until the socket is writable again
+            server_state.selector.modify(conn, selectors.EVENT_READ | selectors.EVENT_WRITE, connection)
+    pending.clear()
+
+def flush_outbuf(conn, connection):
+    """Send queued output now that the socket is writable. Returns False on a send error."""
+    outbuf = connection.outbuf
+    try:
+        sent = conn.send(outbuf)
+    except BlockingIOError:
+        return True
+    except OSError as e:
+        log.error(f"[ERROR] Send error to {connection.addr}: {e}")
+        return False
+    del outbuf[:sent]
+    if not outbuf:
+        server_state.selector.modify(conn, selectors.EVENT_READ, connection)
+    return True
+
+def close_later(conn, connection):
+    """Queue a client for teardown; callers may be iterating over room members"""
+    if not connection.closing:
+        connection.closing = True
+        server_state.closing.append(conn)
+
+def close_pending_clients():
+    """Tear down clients queued by close_later"""
+    while server_state.closing:
+        disconnect_client(server_state.closing.pop())
+
+def settle_connections():
+    """Flush queued output and tear down failed clients, until neither produces more work"""
+    while server_state.pending_output or server_state.closing:
+        flush_pending_output()
+        close_pending_clients()
 
+def setup_client(conn, addr):
+    """Configure a newly accepted client. Returns False if the connection was closed."""
     try:
+        # Check connection limit before spending any work on the socket
+        if server_state.active_connections >= MAX_CLIENTS:
+            conn.send(SERVER_FULL_BYTES)
+            conn.close()
+            return False
+        
         # Enable TCP keepalive to prevent network timeouts
         conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        
-        # Check connection limit
-        if server_state.active_connections >= MAX_CLIENTS:
-            conn.sendall("Server full. Please try again later.\n".encode())
-            return
+        # Disable Nagle so small chat lines and notifications are sent immediately
+        if hasattr(socket, 'TCP_NODELAY'):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
         server_state.active_connections += 1
-        print(f"[CONNECT] New client connected from {addr} ({server_state.active_connections}/{MAX_CLIENTS})")
-        conn.sendall(">>> Welcome to Tempest Server! Use /connect <name> to begin.\n".encode())
+        log.info(f"[CONNECT] New client connected from {addr} ({server_state.active_connections}/{MAX_CLIENTS})")
+        return True
     except Exception as e:
-        print(f"[ERROR] Initial connection setup failed for {addr}: {e}")
-        return
-    
+        log.error(f"[ERROR] Initial connection setup failed for {addr}: {e}")
+        try:
+            conn.close()
+        except:
+            pass
+        return False
+
+def handle_client_data(conn, connection):
+    """Read from a client and process each complete line. Returns True to continue, False to disconnect."""
     try:
-        while True:
-            try:
-                line = conn.recv(1024)
-                if not line:
-                    break
-                line = line.decode('utf-8', errors='ignore').strip()
-            except Exception as e:
-                print(f"[ERROR] Receive error from {addr}: {e}")
-                break
-
-            # Process the line using the message processor
-            should_continue = message_processor.process_line(conn, line, addr)
-            if not should_continue:
-                break
-
-    except socket.timeout:
-        print(f"[TIMEOUT] Client {addr} timed out")
+        data = conn.recv(RECV_SIZE)
+    except BlockingIOError:
+        return True
     except Exception as e:
-        print(f"[ERROR] Client {addr} error: {e}")
+        log.error(f"[ERROR] Receive error from {connection.addr}: {e}")
+        return False
+    if not data:
+        return False
+
+    buffer = connection.buffer
+    buffer.extend(data)
+    while True:
+        newline = buffer.find(b"\n")
+        if newline == -1:
+            break
+        if connection.overflow:
+            # Tail of a line already rejected as too long
+            del buffer[:newline + 1]
+            connection.overflow = False
+            continue
+        line = buffer[:newline].decode('utf-8', errors='ignore').strip()
+        del buffer[:newline + 1]
+
+        # Process the line using the message processor
+        if not message_processor.process_line(conn, line, connection.addr):
+            return False
+
+    # Bound the partial line so a client that never sends a newline can't grow the buffer
+    if len(buffer) > MAX_LINE_BYTES:
+        del buffer[:]
+        if not connection.overflow:
+            connection.overflow = True
+            if not send_to(conn, MESSAGE_TOO_LONG_BYTES):
+                return False
+    return True
+
+def cleanup_client(conn, addr):
+    """Remove a disconnected client from all server state and close its socket"""
+    try:
+        server_state.active_connections -= 1
+        client_info = server_state.clients.pop(conn, None)
+        if client_info is not None:
+            server_state.nicks_lower.discard(client_info.nickname.lower())
+            log.info(f"[CLEANUP] Cleaning up client {client_info.nickname} [{client_info.avatar}] from {addr}")
+            room = server_state.rooms.get(client_info.room)
+            if room is not None and conn in room.members:
+                del room.members[conn]
+                
+                # Clean up typing status
+                room_typing = server_state.typing_users.get(client_info.room, {})
+                if conn in room_typing:
+                    del room_typing[conn]
+                    # Broadcast typing stop to others in room
+                    payload = f"TYPING-STOP {client_info.nickname}\n".encode()
+                    for other_conn in room.members:
+                        send_to(other_conn, payload)
+                
+                # Clean up empty rooms
+                if not room.members:
+                    del server_state.rooms[client_info.room]
+                    if client_info.room in server_state.typing_users:
+                        del server_state.typing_users[client_info.room]
+                else:
+                    broadcast(client_info.room, f"--- {client_info.display_prefix} has left the room ---")
+        else:
+            log.info(f"[CLEANUP] Anonymous client from {addr} disconnected")
+        
+        # Clean up rate limit data
+        server_state.rate_limits.pop(conn, None)
+    except Exception as cleanup_error:
+        log.error(f"[ERROR] Cleanup error for {addr}: {cleanup_error}")
     finally:
-        # Clean up
         try:
-            server_state.active_connections -= 1
-            if conn in server_state.clients:
-                client_info = server_state.clients[conn]
-                print(f"[CLEANUP] Cleaning up client {client_info.nickname} [{client_info.avatar}] from {addr}")
-                if client_info.room and conn in server_state.rooms.get(client_info.room, []):
-                    server_state.rooms[client_info.room].remove(conn)
-                    
-                    # Clean up typing status
-                    room_typing = server_state.typing_users.get(client_info.room, {})
-                    if conn in room_typing:
-                        del room_typing[conn]
-                        # Broadcast typing stop to others in room
-                        for other_conn in server_state.rooms.get(client_info.room, []):
-                            try:
-                                other_conn.sendall(f"TYPING-STOP {client_info.nickname}\n".encode())
-                            except:
-                                pass
-                    
-                    # Clean up empty rooms
-                    if not server_state.rooms[client_info.room]:
-                        del server_state.rooms[client_info.room]
-                        if client_info.room in server_state.messages:
-                            del server_state.messages[client_info.room]
-                        if client_info.room in server_state.typing_users:
-                            del server_state.typing_users[client_info.room]
-                    else:
-                        broadcast(client_info.room, f"--- [{client_info.avatar}] {client_info.nickname} has left the room ---")
-                del server_state.clients[conn]
-            else:
-                print(f"[CLEANUP] Anonymous client from {addr} disconnected")
-            
-            # Clean up rate limit data
-            if conn in server_state.rate_limits:
-                del server_state.rate_limits[conn]
-        except Exception as cleanup_error:
-            print(f"[ERROR] Cleanup error for {addr}: {cleanup_error}")
-        finally:
+            conn.close()
+        except:
+            pass
+
+def listening_socket_inodes(port):
+    """Inodes of TCP sockets listening on a port, read from /proc/net"""
+    port_hex = f"{port:04X}"
+    inodes = set()
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as f:
+                next(f)  # Skip header
+                for row in f:
+                    fields = row.split()
+                    # local_address is ADDR:PORT in hex; state 0A is LISTEN
+                    if fields[1].rsplit(':', 1)[1] == port_hex and fields[3] == '0A':
+                        inodes.add(fields[9])
+        except (OSError, IndexError, StopIteration):
+            pass
+    return inodes
+
+def scan_proc_for_tempest(port=1991):
+    """Find Tempest server processes by walking /proc (Linux), without forking helpers"""
+    sockets = {f"socket:[{inode}]" for inode in listening_socket_inodes(port)}
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            continue  # Process exited or is not readable
+        
+        # Processes running server.py
+        if b'python' in cmdline and b'server.py' in cmdline:
+            pids.append(int(entry))
+            continue
+        
+        # Processes holding the listening socket on the port
+        if sockets:
+            fd_dir = f'/proc/{entry}/fd'
             try:
-                conn.close()
-            except:
-                pass
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    if os.readlink(f'{fd_dir}/{fd}') in sockets:
+                        pids.append(int(entry))
+                        break
+                except OSError:
+                    pass
+    return pids
 
 def find_tempest_processes():
     """Find all running Tempest server processes"""
+    current_pid = os.getpid()
+    if os.path.isdir('/proc/net'):
+        try:
+            return list(set(pid for pid in scan_proc_for_tempest() if pid != current_pid))
+        except OSError:
+            pass  # Fall back to pgrep/lsof
+    
     try:
         # Find processes running server.py
         result = subprocess.run(['pgrep', '-f', 'python.*server.py'], 
@@ -611,7 +825,6 @@ def find_tempest_processes():
             pass
         
         # Remove duplicates and exclude current process
-        current_pid = os.getpid()
         return list(set(pid for pid in pids if pid != current_pid))
     except:
         return []
@@ -661,92 +874,211 @@ def shutdown_tempest_servers():
         print("All Tempest servers have been shut down successfully.")
 
 def cleanup_stale_typing_indicators():
-    """Background task to clean up stale typing indicators"""
-    while True:
-        try:
-            current_time = time.time()
-            TYPING_TIMEOUT = 3.0  # 3 seconds timeout
-            
-            for room_name, room_typing in list(server_state.typing_users.items()):
-                stale_connections = []
-                
-                for conn, timestamp in list(room_typing.items()):
-                    if current_time - timestamp > TYPING_TIMEOUT:
-                        stale_connections.append(conn)
+    """Clear typing indicators that have not been refreshed recently"""
+    current_time = time.time()
+    TYPING_TIMEOUT = 3.0  # 3 seconds timeout
+    
+    for room_name, room_typing in list(server_state.typing_users.items()):
+        stale_connections = []
+        
+        for conn, timestamp in list(room_typing.items()):
+            if current_time - timestamp > TYPING_TIMEOUT:
+                stale_connections.append(conn)
+        
+        # Clean up stale typing indicators
+        for conn in stale_connections:
+            if conn in server_state.clients:
+                client_info = server_state.clients[conn]
+                log.info(f"[TYPING-CLEANUP] {client_info.nickname} typing timeout in room '{room_name}'")
                 
-                # Clean up stale typing indicators
-                for conn in stale_connections:
-                    if conn in server_state.clients:
-                        client_info = server_state.clients[conn]
-                        print(f"[TYPING-CLEANUP] {client_info.nickname} typing timeout in room '{room_name}'")
-                        
-                        # Remove from typing list
-                        if conn in room_typing:
-                            del room_typing[conn]
-                        
-                        # Broadcast typing stop to others in room
-                        for other_conn in server_state.rooms.get(room_name, []):
-                            if other_conn != conn:
-                                try:
-                                    other_conn.sendall(f"TYPING-STOP {client_info.nickname}\n".encode())
-                                except:
-                                    pass
+                # Remove from typing list
+                if conn in room_typing:
+                    del room_typing[conn]
                 
-                # Clean up empty typing rooms
-                if not room_typing:
-                    del server_state.typing_users[room_name]
-            
-            time.sleep(1.0)  # Check every second
+                # Broadcast typing stop to others in room
+                for other_conn in server_state.room_members(room_name):
+                    if other_conn != conn:
+                        send_to(other_conn, f"TYPING-STOP {client_info.nickname}\n".encode())
+        
+        # Clean up empty typing rooms
+        if not room_typing:
+            del server_state.typing_users[room_name]
+
+def accept_clients(sel, server_sock):
+    """Accept up to ACCEPT_BATCH pending connections and register them with the selector"""
+    for _ in range(ACCEPT_BATCH):
+        try:
+            conn, addr = server_sock.accept()
+        except (BlockingIOError, socket.timeout):
+            return
         except Exception as e:
-            print(f"[ERROR] Typing cleanup error: {e}")
-            time.sleep(1.0)
+            log.error(f"[ERROR] Accept error: {e}")
+            return
+        log.info(f"[ACCEPT] Accepting connection from {addr}")
+        conn.setblocking(False)
+        if setup_client(conn, addr):
+            connection = ClientConnection(addr)
+            server_state.connections[conn] = connection
+            sel.register(conn, selectors.EVENT_READ, connection)
+            send_to(conn, WELCOME_BYTES)
 
-def start_server(host='localhost', port=1991):
-    # Start background typing cleanup task
-    typing_cleanup_thread = threading.Thread(target=cleanup_stale_typing_indicators, daemon=True)
-    typing_cleanup_thread.start()
-    
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+def disconnect_client(conn):
+    """Stop watching a client socket and clean up after it"""
+    connection = server_state.connections.pop(conn, None)
+    if connection is None:
+        return  # Already cleaned up
+    connection.closing = True
+    try:
+        server_state.selector.unregister(conn)
+    except (KeyError, ValueError):
+        pass
+    if connection.outbuf:
+        # Last chance for queued output such as the goodbye message
+        try:
+            conn.send(connection.outbuf)
+        except OSError:
+            pass
+    cleanup_client(conn, connection.addr)
+
+def run_event_loop(host, port, reuse_port=False):
+    """Serve clients on host:port in this process until interrupted"""
+    # Exit through the finally below on SIGTERM so queued log records are written
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    listener = start_log_listener()
+    try:
+        serve(host, port, reuse_port)
+    finally:
+        listener.stop()  # Flushes records still in the queue
+
+def serve(host, port, reuse_port):
+    """Bind the listening socket and run the selector loop"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s, selectors.DefaultSelector() as sel:
         # Security configurations
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        s.settimeout(1.0)  # Allow keyboard interrupt
+        if reuse_port:
+            # Let the kernel balance incoming connections across worker processes
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        s.setblocking(False)
         
         try:
             s.bind((host, port))
-            s.listen(5)  # Limit backlog
-            print(f"[SERVER] Tempest Server running on {host}:{port}...")
-            print(f"[CONFIG] Max clients: {MAX_CLIENTS}, Max rooms: {MAX_ROOMS}")
-            
-            while True:
-                try:
-                    conn, addr = s.accept()
-                    print(f"[ACCEPT] Accepting connection from {addr}")
-                    threading.Thread(target=handle_client, args=(conn, addr), daemon=True).start()
-                except socket.timeout:
-                    continue  # Allow graceful shutdown
-                except KeyboardInterrupt:
-                    print("\n[SHUTDOWN] Server shutting down...")
-                    break
-                except Exception as e:
-                    print(f"[ERROR] Accept error: {e}")
-                    continue
+            s.listen(MAX_CLIENTS)  # Limit backlog to the connection cap
         except Exception as e:
-            print(f"[ERROR] Server startup failed: {e}")
+            log.error(f"[ERROR] Server startup failed: {e}")
             return
+        
+        log.info(f"[SERVER] Tempest Server running on {host}:{port} (pid {os.getpid()})...")
+        log.info(f"[CONFIG] Max clients: {MAX_CLIENTS}, Max rooms: {MAX_ROOMS}")
+        
+        # A single thread multiplexes the listening socket and all clients
+        server_state.selector = sel
+        sel.register(s, selectors.EVENT_READ, None)
+        next_typing_cleanup = time.monotonic() + 1.0
+        
+        try:
+            while True:
+                # Wake at least once a second for typing cleanup
+                for key, events in sel.select(timeout=1.0):
+                    if key.data is None:
+                        accept_clients(sel, s)
+                        continue
+                    
+                    conn, connection = key.fileobj, key.data
+                    if connection.closing:
+                        continue  # Torn down earlier in this batch
+                    keep_open = True
+                    try:
+                        if events & selectors.EVENT_WRITE:
+                            keep_open = flush_outbuf(conn, connection)
+                        if keep_open and events & selectors.EVENT_READ:
+                            keep_open = handle_client_data(conn, connection)
+                    except Exception as e:
+                        log.error(f"[ERROR] Client {connection.addr} error: {e}")
+                        keep_open = False
+                    if not keep_open:
+                        disconnect_client(conn)
+                
+                # Everything queued for a client while handling this batch goes out in one send
+                settle_connections()
+                
+                now = time.monotonic()
+                if now >= next_typing_cleanup:
+                    try:
+                        cleanup_stale_typing_indicators()
+                    except Exception as e:
+                        log.error(f"[ERROR] Typing cleanup error: {e}")
+                    settle_connections()
+                    next_typing_cleanup = now + 1.0
+        except KeyboardInterrupt:
+            log.info("\n[SHUTDOWN] Server shutting down...")
 
-if __name__ == "__main__":
-    import sys
+def start_server(host='localhost', port=1991, workers=1):
+    if workers <= 1:
+        run_event_loop(host, port)
+        return
     
+    if not hasattr(socket, 'SO_REUSEPORT') or not hasattr(os, 'fork'):
+        print("[ERROR] Multiple workers need SO_REUSEPORT and fork(); running a single process")
+        run_event_loop(host, port)
+        return
+    
+    # Each worker has its own listening socket and its own state: rooms are per worker
+    print(f"[SERVER] Starting {workers} worker processes on {host}:{port}")
+    sys.stdout.flush()  # Don't let children inherit and repeat buffered output
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_event_loop(host, port, reuse_port=True)
+            finally:
+                sys.stdout.flush()
+                os._exit(0)
+        children.append(pid)
+    
+    def stop_workers(signum=None, frame=None):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGTERM, stop_workers)
+    remaining = set(children)
+    while remaining:
+        try:
+            pid, _ = os.wait()
+            remaining.discard(pid)
+        except KeyboardInterrupt:
+            stop_workers()  # Workers in the same process group got the SIGINT too
+        except ChildProcessError:
+            break
+    print("[SHUTDOWN] All workers stopped")
+
+if __name__ == "__main__":
     host = 'localhost'  # Default to localhost for security
     port = 1991
+    workers = 1
+    
+    # Pull out --workers N before the positional arguments
+    args = sys.argv[1:]
+    if '--workers' in args:
+        i = args.index('--workers')
+        try:
+            workers = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("Error: --workers requires a number of processes.")
+            sys.exit(1)
+        del args[i:i + 2]
     
     # Parse command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] == '--help' or sys.argv[1] == '-h':
+    if len(args) > 0:
+        if args[0] == '--help' or args[0] == '-h':
             print("Usage: python server.py [options] [host] [port]")
             print()
             print("Options:")
             print("  --shutdown         Shutdown all running Tempest servers")
+            print("  --workers N        Run N processes sharing the port (rooms are per process)")
             print("  --help, -h         Show this help message")
             print()
             print("Arguments:")
@@ -758,24 +1090,24 @@ if __name__ == "__main__":
             print("  python server.py                  # localhost:1991")
             print("  python server.py 0.0.0.0          # all interfaces:1991")
             print("  python server.py 0.0.0.0 8080     # all interfaces:8080")
+            print("  python server.py --workers 4      # 4 processes on localhost:1991")
             print("  python server.py --shutdown       # shutdown running servers")
             sys.exit(0)
-        elif sys.argv[1] == '--shutdown':
+        elif args[0] == '--shutdown':
             shutdown_tempest_servers()
             sys.exit(0)
         
-        # Parse host/port arguments (skip if first arg was a flag)
-        arg_start = 1
-        host = sys.argv[arg_start]
-        if len(sys.argv) > arg_start + 1:
+        # Parse host/port arguments
+        host = args[0]
+        if len(args) > 1:
             try:
-                port = int(sys.argv[arg_start + 1])
+                port = int(args[1])
             except ValueError:
-                print(f"Error: Invalid port '{sys.argv[arg_start + 1]}'. Must be a number.")
+                print(f"Error: Invalid port '{args[1]}'. Must be a number.")
                 sys.exit(1)
     
     if host == '0.0.0.0':
         print("WARNING: Server will accept connections from any IP address!")
         print("Make sure your firewall is properly configured.")
     
-    start_server(host, port)
\ No newline at end of file
+    start_server(host, port, workers)
\ No newline at end of file
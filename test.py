@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 
 import socket
+import struct
+import select
+import selectors
 import threading
 import time
 import sys
 import subprocess
 import signal
 import os
-from contextlib import contextmanager
+import re
+import functools
+import uuid
+import tempfile
+import concurrent.futures
+import importlib.util
+from contextlib import contextmanager, ExitStack
 
 class Colors:
     RED = '\033[0;31m'
@@ -15,13 +24,42 @@ class Colors:
     YELLOW = '\033[1;33m'
     NC = '\033[0m'  # No Color
 
+class TestSocket(socket.socket):
+    """Client socket with a reusable one-page receive buffer, so reads don't allocate"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scratch = bytearray(4096)
+        self.buf = bytearray()  # Received but not yet consumed by a wait
+
+    def fill(self):
+        """Append one read to buf; returns False on EOF"""
+        n = self.recv_into(self.scratch)
+        self.buf += memoryview(self.scratch)[:n]
+        return n > 0
+
+# Records "<pid> <server.py mtime>" for a server kept alive by --reuse
+PID_FILE = os.path.join(tempfile.gettempdir(), 'tempest_test.pid')
+
+# Version pattern in the WELCOME line (v followed by characters, handling newlines)
+VERSION_RE = re.compile(r'v[a-zA-Z0-9*]+(?:\n|$|\s)')
+
+# Commands /help must list
+HELP_COMMANDS = (b'/connect', b'/room', b'/who', b'/help', b'/bye')
+
+# Server rate limit: a token bucket of 20 messages, refilled at one every 3 seconds
+RATE_BURST = 20
+RATE_REFILL_SECONDS = 3.0
+
 class TempestTestSuite:
-    def __init__(self):
+    def __init__(self, reuse=False, fresh=False):
         self.server_process = None
         self.test_port = 1991
         self.use_existing_server = False
+        self.reuse = reuse
+        self.fresh = fresh
         self.tests_passed = 0
         self.tests_failed = 0
+        self.results_lock = threading.Lock()
         
     def print_colored(self, message, color=Colors.NC):
         print(f"{color}{message}{Colors.NC}")
@@ -30,51 +68,129 @@ class TempestTestSuite:
         """Check if port is already in use"""
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(1)
+                # Loopback refusals are immediate; a short timeout keeps polling fast
+                sock.settimeout(0.05)
+                # Reset on close so tight polling doesn't pile up TIME_WAIT sockets
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 result = sock.connect_ex(('localhost', port))
                 return result == 0
         except:
             return False
         
+    def read_cached_server(self):
+        """Return (pid, mtime) of the server a previous --reuse run left running, or None"""
+        try:
+            with open(PID_FILE) as f:
+                pid, mtime = f.read().split()
+            pid, mtime = int(pid), float(mtime)
+        except (OSError, ValueError):
+            return None
+        # The server may have died and its PID been recycled: only trust the PID
+        # if it is still a server.py process and the test port is answering
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                args = f.read().split(b'\0')
+        except OSError:
+            args = []
+        if (any(os.path.basename(arg) == b'server.py' for arg in args)
+                and self.check_port_in_use(self.test_port)):
+            return pid, mtime
+        self.remove_pid_file()
+        return None
+
+    def remove_pid_file(self):
+        """Forget the cached server"""
+        try:
+            os.remove(PID_FILE)
+        except OSError:
+            pass
+
+    def kill_cached_server(self, pid):
+        """Terminate a cached server and wait for its port to free up"""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+        self.remove_pid_file()
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline and self.check_port_in_use(self.test_port):
+            time.sleep(0.01)
+
     def start_server(self):
         """Start the Tempest server"""
+        cached = self.read_cached_server()
+        if cached:
+            pid, mtime = cached
+            # Reuse only if server.py hasn't changed since the cached server started
+            if self.reuse and not self.fresh and mtime == os.path.getmtime('server.py'):
+                self.print_colored(f"Reusing cached server (pid {pid})", Colors.YELLOW)
+                self.use_existing_server = True
+                return True
+            self.kill_cached_server(pid)
+
         if self.check_port_in_use(self.test_port):
             self.print_colored("Server already running on port 1991", Colors.YELLOW)
             self.use_existing_server = True
             return True
 
         try:
-            self.server_process = subprocess.Popen(
-                [sys.executable, 'server.py'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            if self.reuse:
+                # Outlives this run, so nothing would drain its output pipes
+                self.server_process = subprocess.Popen(
+                    [sys.executable, 'server.py'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                with open(PID_FILE, 'w') as f:
+                    f.write(f"{self.server_process.pid} {os.path.getmtime('server.py')}")
+            else:
+                self.server_process = subprocess.Popen(
+                    [sys.executable, 'server.py'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE
+                )
             
-            # Wait for server to start
-            time.sleep(2)
+            # Poll until the server accepts connections, up to 2 seconds
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                # Check if server is still running
+                if self.server_process.poll() is not None:
+                    self.print_colored("Server failed to start", Colors.RED)
+                    return False
+                if self.check_port_in_use(self.test_port):
+                    return True
+                time.sleep(0.01)
             
-            # Check if server is still running
-            if self.server_process.poll() is not None:
-                self.print_colored("Server failed to start", Colors.RED)
-                return False
-                
-            # Check if port is listening
-            if not self.check_port_in_use(self.test_port):
-                self.print_colored("Server not listening on port", Colors.RED)
-                return False
-
-            return True
+            self.print_colored("Server not listening on port", Colors.RED)
+            return False
             
         except Exception as e:
             self.print_colored(f"Failed to start server: {e}", Colors.RED)
             return False
             
+    def wait_for_exit(self, timeout):
+        """Wait for the server process to exit, woken by a pidfd where the OS has one"""
+        try:
+            pidfd = os.pidfd_open(self.server_process.pid)
+        except (AttributeError, OSError):
+            # No pidfd support (non-Linux or kernel < 5.3): Popen.wait polls
+            return self.server_process.wait(timeout=timeout)
+        try:
+            # The pidfd turns readable the moment the process exits
+            if not select.select([pidfd], [], [], timeout)[0]:
+                raise subprocess.TimeoutExpired(self.server_process.args, timeout)
+        finally:
+            os.close(pidfd)
+        return self.server_process.wait()
+
     def stop_server(self):
         """Stop the Tempest server"""
-        if self.server_process and not self.use_existing_server:
+        if self.server_process and not self.use_existing_server and not self.reuse:
             self.server_process.terminate()
             try:
-                self.server_process.wait(timeout=5)
+                self.wait_for_exit(timeout=5)
             except subprocess.TimeoutExpired:
                 self.server_process.kill()
                 self.server_process.wait()
@@ -84,182 +200,226 @@ class TempestTestSuite:
         """Context manager for test client connections"""
         client = None
         try:
-            client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            client = TestSocket(socket.AF_INET, socket.SOCK_STREAM)
             client.settimeout(timeout)
+            # Short command/reply exchanges shouldn't wait on Nagle + delayed ACK
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             client.connect(('localhost', self.test_port))
             yield client
         finally:
             if client:
-                try:
-                    client.sendall(b'/bye\n')
-                    client.close()
-                except:
-                    pass
+                self._close_client(client)
+                    
+    def _close_client(self, sock):
+        """Say /bye and close, even if the server has already dropped the connection"""
+        try:
+            sock.sendall(b'/bye\n')
+        except OSError:
+            pass
+        sock.close()
+
+    def _unique(self, prefix):
+        """Name that won't collide with other tests running concurrently"""
+        return f"{prefix}_{uuid.uuid4().hex[:6]}"
+
+    def _take(self, sock, match):
+        """Remove and return sock's buffered data through the line completing match, or None if not there yet"""
+        buf = sock.buf
+        if callable(match):
+            # A predicate has no position, so it consumes everything buffered
+            if not match(buf):
+                return None
+            end = len(buf)
+        else:
+            start = buf.find(match)
+            if start == -1:
+                return None
+            end = buf.find(b'\n', start + len(match) - 1)
+            if end == -1:
+                return None  # Rest of the line is still on its way
+            end += 1
+        data = bytes(buf[:end])
+        del buf[:end]
+        return data
+
+    def _wait_for(self, sock, match, timeout=2.0):
+        """Read until match (bytes, or a predicate on the data) is seen; returns the data, or None on timeout/EOF"""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = self._take(sock, match)
+            if data is not None:
+                return data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if not ready or not sock.fill():
+                return None
+                    
+    def _recv_from(self, sel, sock, match, timeout=2.0):
+        """Like _wait_for, but keeps filling every socket registered on sel while waiting"""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = self._take(sock, match)
+            if data is not None:
+                return data
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            for key, _ in sel.select(remaining):
+                if not key.fileobj.fill():
+                    return None
+
+    def _drain(self, sock):
+        """Discard whatever has already arrived, without waiting for more"""
+        # MSG_DONTWAIT doesn't help on a socket with a timeout: Python waits
+        # for readability before calling recv, so poll with select instead
+        sock.buf.clear()
+        while select.select([sock], [], [], 0)[0]:
+            if not sock.recv_into(sock.scratch):
+                break
                     
     def run_test(self, test_name, test_func):
         """Run a single test and track results"""
         # self.print_colored(f"\n🧪 {test_name}", Colors.YELLOW)
         try:
-            if test_func():
+            passed = test_func()
+            error = None
+        except Exception as e:
+            passed = False
+            error = e
+        with self.results_lock:
+            if passed:
                 self.print_colored(f"- {test_name} PASSED")
                 self.tests_passed += 1
-                return True
-            else:
+            elif error is None:
                 self.print_colored(f"- {test_name} FAILED", Colors.RED)
                 self.tests_failed += 1
-                return False
-        except Exception as e:
-            self.print_colored(f"- {test_name} FAILED: {e}", Colors.RED)
-            self.tests_failed += 1
-            return False
+            else:
+                self.print_colored(f"- {test_name} FAILED: {error}", Colors.RED)
+                self.tests_failed += 1
+        return passed
             
     def test_basic_connection(self):
         """Test basic server connection and welcome message"""
         with self.test_client() as client:
             # Read welcome message
-            welcome = client.recv(1024).decode().strip()
+            n = client.recv_into(client.scratch)
+            welcome = client.scratch[:n].decode().strip()
             # case-insensitive check
             if "welcome to tempest server" not in welcome.lower():
                 return False
 
             # Test /connect command
-            client.sendall(b'/connect testuser\n')
-            time.sleep(0.1)
-            response = client.recv(1024).decode().strip()
+            nick = self._unique('testuser')
+            client.sendall(f'/connect {nick}\n'.encode())
             # case-insensitive match for WELCOME testuser
-            return "WELCOME TESTUSER" in response.upper()
+            expected = f"WELCOME {nick}".upper().encode()
+            response = self._wait_for(client, lambda buf: expected in buf.upper())
+            return response is not None
 
     def test_room_list_on_connect(self):
         """Test that room list is sent when client connects"""
         with self.test_client() as client:
-            client.recv(1024)  # welcome
-            client.sendall(b'/connect testuser\n')
-            time.sleep(0.1)
+            nick = self._unique('testuser')
+            client.sendall(f'/connect {nick}\n'.encode())
 
-            try:
-                response = client.recv(1024).decode()
-                # case-insensitive match
-                return "WELCOME TESTUSER" in response.upper()
-            except:
-                return False
+            # case-insensitive match
+            expected = f"WELCOME {nick}".upper().encode()
+            response = self._wait_for(client, lambda buf: expected in buf.upper())
+            return response is not None
 
     def test_help_command(self):
         """Test /help command functionality"""
         with self.test_client() as client:
-            # Skip welcome message
-            client.recv(1024)
-
             # Test /help command
             client.sendall(b'/help\n')
-            time.sleep(0.1)
-            help_response = client.recv(1024).decode()
-
             # Verify help contains expected commands
-            expected_commands = ['/connect', '/room', '/who', '/help', '/bye']
-            if not all(cmd in help_response for cmd in expected_commands):
+            help_response = self._wait_for(client, lambda buf: all(cmd in buf for cmd in HELP_COMMANDS))
+            if help_response is None:
                 return False
 
             # Test unknown command feedback
             client.sendall(b'/unknown\n')
-            time.sleep(0.1)
-            unknown_response = client.recv(1024).decode()
             # relax to any mention of "help"
-            return "help" in unknown_response.lower()
+            unknown_response = self._wait_for(client, lambda buf: b"help" in buf.lower())
+            return unknown_response is not None
 
     def test_room_operations(self):
         """Test room joining and messaging"""
         with self.test_client() as client:
-            # Skip welcome message
-            client.recv(1024)
-            
             # Connect user
-            client.sendall(b'/connect alice\n')
-            time.sleep(0.1)
-            client.recv(1024)  # consume response
+            nick = self._unique('alice')
+            client.sendall(f'/connect {nick}\n'.encode())
+            self._drain(client)  # consume response
             
             # Join room
-            client.sendall(b'/room #testroom\n')
-            time.sleep(0.1)
-            room_response = client.recv(1024).decode()
+            room = self._unique('#testroom')
+            client.sendall(f'/room {room}\n'.encode())
+            room_response = self._wait_for(client, f'>>> Entered room: {room}'.encode())
             
-            if ">>> Entered room: #testroom" not in room_response:
+            if room_response is None:
                 return False
                 
             # Send message
             client.sendall(b'Hello from test!\n')
-            time.sleep(0.1)
             
             # Test /who command
             client.sendall(b'/who\n')
-            time.sleep(0.1)
-            who_response = client.recv(1024).decode()
+            who_response = self._wait_for(client, b'Users in room')
             
-            return "alice" in who_response
+            return who_response is not None and nick.encode() in who_response
             
     def test_multiple_clients(self):
         """Test multiple client communication"""
-        def client_alice():
-            with self.test_client() as alice:
-                alice.recv(1024)  # welcome
-                alice.sendall(b'/connect alice\n')
-                time.sleep(0.1)
-                alice.recv(1024)  # welcome response
+        # Both clients are driven from this thread; their steps interleave in order
+        with self.test_client() as alice, self.test_client() as bob:
+            sel = selectors.DefaultSelector()
+            try:
+                sel.register(alice, selectors.EVENT_READ)
+                sel.register(bob, selectors.EVENT_READ)
                 
+                alice.sendall(b'/connect alice\n')
                 alice.sendall(b'/room #multiclient\n')
-                time.sleep(0.1)
-                alice.recv(1024)  # room response
                 
+                # Seeing our own message echoed means the server has stored it
                 alice.sendall(b'Hello from Alice!\n')
-                time.sleep(2)  # Wait for Bob to join
-                
-                # Try to receive Bob's message
-                try:
-                    alice.settimeout(3)
-                    data = alice.recv(1024).decode()
-                    return "bob: Hello from Bob!" in data
-                except socket.timeout:
+                if self._recv_from(sel, alice, b'alice: Hello from Alice!') is None:
                     return False
-                    
-        def client_bob():
-            time.sleep(1)  # Let Alice join first
-            with self.test_client() as bob:
-                bob.recv(1024)  # welcome
-                bob.sendall(b'/connect bob\n')
-                time.sleep(0.1)
-                bob.recv(1024)  # welcome response
                 
+                # Bob joins only after Alice's message is in the room
+                bob.sendall(b'/connect bob\n')
                 bob.sendall(b'/room #multiclient\n')
-                time.sleep(0.1)
-                room_data = bob.recv(1024).decode()
+                
+                # History arrives between the room response and Bob's own join notice
+                room_data = self._recv_from(sel, bob, b'bob has entered the room') or b''
                 
                 # Should see Alice's message in history
-                alice_msg_in_history = "alice: Hello from Alice!" in room_data
+                alice_msg_in_history = b"alice: Hello from Alice!" in room_data
                 
                 bob.sendall(b'Hello from Bob!\n')
-                time.sleep(0.1)
                 
-                return alice_msg_in_history
+                # Try to receive Bob's message
+                bob_msg_received = self._recv_from(sel, alice, b"bob: Hello from Bob!", 3.0) is not None
                 
-        # Run both clients concurrently
-        import concurrent.futures
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            alice_future = executor.submit(client_alice)
-            bob_future = executor.submit(client_bob)
-            
-            alice_result = alice_future.result(timeout=10)
-            bob_result = bob_future.result(timeout=10)
-            
-        return alice_result or bob_result  # At least one should work
+                return alice_msg_in_history and bob_msg_received
+            finally:
+                sel.close()
         
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_client_module():
+        """Load client.py once and hand back the same module on later calls"""
+        spec = importlib.util.spec_from_file_location("client", "client.py")
+        client_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(client_module)
+        return client_module
+
     def test_python_client_connectivity(self):
         """Test that Python client can connect (basic connectivity test)"""
         try:
             # Import the client module to test basic functionality
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("client", "client.py")
-            client_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(client_module)
+            client_module = self._load_client_module()
             
             # Test basic connection without TUI
             test_client = client_module.TempestClient('localhost', self.test_port)
@@ -278,22 +438,17 @@ class TempestTestSuite:
         """Test server resilience against large payload attacks"""
         with self.test_client(timeout=10) as client:
             try:
-                client.recv(1024)  # welcome
-                client.sendall(b'/connect testuser\n')
-                time.sleep(0.1)
-                client.recv(1024)  # welcome response
+                nick = self._unique('testuser')
+                client.sendall(f'/connect {nick}\n'.encode())
+                self._wait_for(client, f'Welcome {nick}'.encode())  # welcome response
                 
                 # Send oversized nickname (potential buffer overflow)
                 large_nickname = 'A' * 10000
                 client.sendall(f'/connect {large_nickname}\n'.encode())
-                time.sleep(0.1)
                 
-                # Server should still respond (not crash)
-                try:
-                    response = client.recv(1024)
-                    return len(response) > 0
-                except socket.timeout:
-                    return False
+                # Server should still respond (not crash) with an error for the oversized line
+                response = self._wait_for(client, b'Error:', timeout=10)
+                return response is not None
             except Exception:
                 return False
 
@@ -301,16 +456,13 @@ class TempestTestSuite:
         """Test for injection vulnerabilities in nicknames"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
-                
                 # Try injection-like nickname (short enough to test character validation)
                 malicious_nick = "admin<script>"
                 client.sendall(f'/connect {malicious_nick}\n'.encode())
-                time.sleep(0.1)
-                response = client.recv(1024).decode()
                 
                 # Server should reject malicious input with error message
-                return "Error:" in response and "invalid characters" in response
+                response = self._wait_for(client, lambda buf: b"Error:" in buf and b"invalid characters" in buf)
+                return response is not None
             except Exception:
                 return False
 
@@ -318,19 +470,80 @@ class TempestTestSuite:
         """Test for injection vulnerabilities in room names"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
-                client.sendall(b'/connect testuser\n')
-                time.sleep(0.1)
-                client.recv(1024)  # welcome response
+                nick = self._unique('testuser')
+                client.sendall(f'/connect {nick}\n'.encode())
+                self._drain(client)  # welcome response
                 
                 # Try malicious room name
                 malicious_room = "#room<script>alert('xss')</script>"
                 client.sendall(f'/room {malicious_room}\n'.encode())
-                time.sleep(0.1)
-                response = client.recv(1024).decode()
                 
                 # Server should reject malicious input with error message
-                return "Error:" in response and "invalid characters" in response.lower()
+                response = self._wait_for(client, lambda buf: b"Error:" in buf and b"invalid characters" in buf.lower())
+                return response is not None
+            except Exception:
+                return False
+
+    def test_duplicate_nickname(self):
+        """Test that a nickname already in use is rejected, ignoring case"""
+        with self.test_client() as first, self.test_client() as second:
+            try:
+                nick = self._unique('Dup')
+                first.sendall(f'/connect {nick}\n'.encode())
+                if self._wait_for(first, f'Welcome {nick}'.encode()) is None:
+                    return False
+                
+                # Same name in a different case from another connection
+                second.sendall(f'/connect {nick.lower()}\n'.encode())
+                response = self._wait_for(second, b'Nickname already in use')
+                return response is not None
+            except Exception:
+                return False
+
+    def test_reconnect_room_cleanup(self):
+        """Test that re-connecting and switching rooms leaves no stale room behind"""
+        with self.test_client() as client:
+            try:
+                nick = self._unique('renick')
+                first_room = self._unique('#firstroom')
+                client.sendall(f'/connect {nick}\n'.encode())
+                client.sendall(f'/room {first_room}\n'.encode())
+                # Re-connect with the same nickname, then move on to another room
+                client.sendall(f'/connect {nick}\n'.encode())
+                client.sendall(f'/room {self._unique("#secondroom")}\n'.encode())
+                client.sendall(b'/bye\n')
+                if self._wait_for(client, b'Goodbye') is None:
+                    return False
+            except Exception:
+                return False
+        
+        # The first room emptied when the client moved on, so it must not be listed
+        with self.test_client() as viewer:
+            try:
+                viewer.sendall(f'/connect {self._unique("viewer")}\n'.encode())
+                response = self._wait_for(viewer, lambda buf: b'ctive rooms' in buf)
+                return response is not None and first_room.encode() not in response
+            except Exception:
+                return False
+
+    def test_command_word_boundary(self):
+        """Test that commands only match as whole words"""
+        with self.test_client() as client:
+            try:
+                nick = self._unique('testuser')
+                client.sendall(f'/connect {nick}\n'.encode())
+                self._drain(client)  # welcome response
+                
+                # A known command with extra letters is a different, unknown command
+                for cmd in (b'/roomx\n', b'/whox\n'):
+                    client.sendall(cmd)
+                    if self._wait_for(client, b'Unknown command') is None:
+                        return False
+                
+                # The command itself, followed by its argument, still works
+                room = self._unique('#testroom')
+                client.sendall(f'/room {room}\n'.encode())
+                return self._wait_for(client, f'Entered room: {room}'.encode()) is not None
             except Exception:
                 return False
 
@@ -338,70 +551,97 @@ class TempestTestSuite:
         """Test server resilience against message flooding"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
                 client.sendall(b'/connect flooduser\n')
-                time.sleep(0.1)
-                client.recv(1024)  # welcome response
+                self._drain(client)  # welcome response
                 
                 client.sendall(b'/room #floodroom\n')
-                time.sleep(0.1)
-                client.recv(1024)  # room response
+                self._drain(client)  # room response
                 
-                # Flood with messages
-                for i in range(100):
-                    client.sendall(f'Flood message {i}\n'.encode())
-                    if i % 10 == 0:
-                        time.sleep(0.01)  # Brief pause to avoid overwhelming
+                # Flood with messages, all in one write
+                flood = b"".join(f'Flood message {i}\n'.encode() for i in range(100))
+                client.sendall(flood)
                 
                 # Server should still respond
                 client.sendall(b'/who\n')
-                time.sleep(0.5)
-                response = client.recv(1024)
-                return len(response) > 0
+                response = self._wait_for(client, b'Users in room')
+                return response is not None
+            except Exception:
+                return False
+
+    def test_rate_limit_refill(self):
+        """Test that a full burst is accepted and sending resumes after a refill"""
+        with self.test_client() as client:
+            try:
+                nick = self._unique('burstuser')
+                client.sendall(f'/connect {nick}\n'.encode())
+                client.sendall(f'/room {self._unique("#burstroom")}\n'.encode())
+                self._drain(client)  # welcome and room responses
+                
+                # A full bucket's worth of messages goes through without a warning
+                burst = b"".join(f'Burst message {i}\n'.encode() for i in range(RATE_BURST))
+                client.sendall(burst)
+                response = self._wait_for(client, f'Burst message {RATE_BURST - 1}'.encode())
+                if response is None or b'Rate limit exceeded' in response:
+                    return False
+                
+                # The bucket is now empty
+                client.sendall(b'One too many\n')
+                if self._wait_for(client, b'Rate limit exceeded') is None:
+                    return False
+                
+                # One refill interval later a message is accepted again
+                time.sleep(RATE_REFILL_SECONDS + 0.1)
+                client.sendall(b'After refill\n')
+                response = self._wait_for(client, lambda buf: b'After refill' in buf or b'Rate limit' in buf)
+                return response is not None and b'Rate limit' not in response
             except Exception:
                 return False
 
     def test_connection_flooding(self):
         """Test server resilience against connection flooding"""
-        connections = []
-        try:
-            # Try to open many connections quickly
-            for i in range(20):
-                try:
-                    conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    conn.settimeout(2)
-                    conn.connect(('localhost', self.test_port))
-                    connections.append(conn)
-                    conn.recv(1024)  # consume welcome
-                except Exception:
-                    break
-            
-            # Try to use the last connection
-            if connections:
-                last_conn = connections[-1]
-                last_conn.sendall(b'/help\n')
-                time.sleep(0.1)
-                response = last_conn.recv(1024)
-                return len(response) > 0
-            
-            return len(connections) > 5  # Should handle at least a few connections
-        except Exception:
-            return False
-        finally:
-            # Clean up connections
-            for conn in connections:
-                try:
-                    conn.sendall(b'/bye\n')
-                    conn.close()
-                except:
-                    pass
+        def open_one():
+            conn = TestSocket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                conn.settimeout(2)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Keep kernel buffers small with many sockets open at once
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 16384)
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16384)
+                conn.connect(('localhost', self.test_port))
+                conn.recv_into(conn.scratch)  # consume welcome
+                return conn
+            except Exception:
+                conn.close()
+                return None
+
+        # Every opened connection is closed on the way out, however the test ends
+        with ExitStack() as stack:
+            try:
+                # Open many connections at once, as a burst rather than a stream
+                with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+                    futures = [executor.submit(open_one) for _ in range(20)]
+                connections = []
+                for future in futures:
+                    conn = future.result()
+                    if conn:
+                        stack.callback(self._close_client, conn)
+                        connections.append(conn)
+                
+                # Try to use the last connection
+                if connections:
+                    last_conn = connections[-1]
+                    last_conn.sendall(b'/help\n')
+                    response = self._wait_for(last_conn, b'/bye')
+                    return response is not None
+                
+                return len(connections) > 5  # Should handle at least a few connections
+            except Exception:
+                return False
 
     def test_malformed_commands(self):
         """Test server resilience against malformed commands"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
-                
                 # Send various malformed commands
                 malformed_commands = [
                     b'/connect\n',  # No argument
@@ -416,17 +656,12 @@ class TempestTestSuite:
                 
                 for cmd in malformed_commands:
                     client.sendall(cmd)
-                    time.sleep(0.05)
-                    try:
-                        client.recv(1024)  # Try to consume response
-                    except socket.timeout:
-                        pass
+                    self._drain(client)  # Response is irrelevant here
                 
                 # Server should still respond to valid commands
                 client.sendall(b'/help\n')
-                time.sleep(0.1)
-                response = client.recv(1024)
-                return b'help' in response.lower()
+                response = self._wait_for(client, b'/bye')
+                return response is not None
             except Exception:
                 return False
 
@@ -434,25 +669,20 @@ class TempestTestSuite:
         """Test server resilience against room creation flooding"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
                 client.sendall(b'/connect roomspammer\n')
-                time.sleep(0.1)
-                client.recv(1024)  # welcome response
-                
-                # Create many rooms
-                for i in range(50):
-                    client.sendall(f'/room #testroom{i}\n'.encode())
-                    time.sleep(0.01)
-                    try:
-                        client.recv(1024)  # consume response
-                    except socket.timeout:
-                        pass
+                self._drain(client)  # welcome response
+                
+                # Create many rooms, all commands in one write
+                payload = b"".join(f'/room #testroom{i}\n'.encode() for i in range(50))
+                client.sendall(payload)
+                # Proof the last room was processed
+                if self._wait_for(client, b'Entered room: #testroom49') is None:
+                    return False
                 
                 # Server should still respond
                 client.sendall(b'/who\n')
-                time.sleep(0.1)
-                response = client.recv(1024)
-                return len(response) > 0
+                response = self._wait_for(client, b'Users in room')
+                return response is not None
             except Exception:
                 return False
 
@@ -460,24 +690,22 @@ class TempestTestSuite:
         """Test server handling of unicode and special characters"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome
+                client.recv_into(client.scratch)  # welcome
                 
                 # Test unicode in nickname
                 unicode_nick = "test用户🔥💀"
                 client.sendall(f'/connect {unicode_nick}\n'.encode('utf-8'))
-                time.sleep(0.1)
-                response = client.recv(1024)
+                response = self._wait_for(client, b'\n')
                 
-                if len(response) == 0:
+                if response is None:
                     return False
                 
                 # Test unicode in room name
                 unicode_room = "#房间🏠"
                 client.sendall(f'/room {unicode_room}\n'.encode('utf-8'))
-                time.sleep(0.1)
-                response = client.recv(1024)
+                response = self._wait_for(client, b'\n')
                 
-                return len(response) > 0
+                return response is not None
             except Exception:
                 return False
 
@@ -485,22 +713,19 @@ class TempestTestSuite:
         """Test that server sends version information in WELCOME message"""
         with self.test_client() as client:
             try:
-                client.recv(1024)  # welcome message
-                
                 # Connect user
-                client.sendall(b'/connect testuser\n')
-                time.sleep(0.1)
-                response = client.recv(1024).decode().strip()
+                nick = self._unique('testuser')
+                client.sendall(f'/connect {nick}\n'.encode())
+                expected = f"WELCOME {nick}".upper().encode()
+                response = self._wait_for(client, lambda buf: expected in buf.upper())
                 
                 # Check if response contains version information
                 # Format should be: "WELCOME testuser [avatar] vVERSION"
-                if "WELCOME TESTUSER" not in response.upper():
+                if response is None:
                     return False
+                response = response.decode().strip()
                 
-                # Check for version pattern (v followed by characters, handling newlines)
-                import re
-                version_pattern = r'v[a-zA-Z0-9*]+(?:\n|$|\s)'
-                has_version = bool(re.search(version_pattern, response))
+                has_version = bool(VERSION_RE.search(response))
                 
                 return has_version
                 
@@ -512,90 +737,54 @@ class TempestTestSuite:
         """Test typing indicator functionality"""
         # Create two clients
         with self.test_client() as client1, self.test_client() as client2:
+            sel = selectors.DefaultSelector()
             try:
-                # Both clients connect
-                client1.recv(1024)  # welcome
-                client2.recv(1024)  # welcome
+                # Collect whatever either client receives, banners included
+                sel.register(client1, selectors.EVENT_READ)
+                sel.register(client2, selectors.EVENT_READ)
                 
+                # Both clients connect
                 client1.sendall(b'/connect alice\n')
-                time.sleep(0.1)
-                client1.recv(1024)  # welcome response
-                
                 client2.sendall(b'/connect bob\n')
-                time.sleep(0.1)
-                client2.recv(1024)  # welcome response
                 
                 # Both join the same room
                 client1.sendall(b'/room #testroom\n')
-                time.sleep(0.1)
-                client1.recv(1024)  # room join response
-                
                 client2.sendall(b'/room #testroom\n')
-                time.sleep(0.1)
-                client2.recv(1024)  # room join response
-                
-                # Clear any remaining messages (like "alice entered room")
-                try:
-                    client2.recv(1024)
-                except socket.timeout:
-                    pass
+                self._recv_from(sel, client2, b'bob has entered the room')
                 
                 # Test basic typing indicator
                 client1.sendall(b'/typing\n')
-                time.sleep(0.2)
                 
                 # Client2 should receive typing notification
-                try:
-                    response = client2.recv(1024).decode()
-                    if 'TYPING alice' not in response:
-                        return False
-                except socket.timeout:
+                if self._recv_from(sel, client2, b'TYPING alice') is None:
                     return False
                 
                 # Test typing stop
                 client1.sendall(b'/typing-stop\n')
-                time.sleep(0.2)
                 
-                try:
-                    response = client2.recv(1024).decode()
-                    if 'TYPING-STOP alice' not in response:
-                        return False
-                except socket.timeout:
+                if self._recv_from(sel, client2, b'TYPING-STOP alice') is None:
                     return False
                 
                 # Test that sending a message auto-stops typing
                 client1.sendall(b'/typing\n')
-                time.sleep(0.1)
                 
                 # Consume the typing notification
-                try:
-                    client2.recv(1024)
-                except socket.timeout:
-                    pass
+                self._recv_from(sel, client2, b'TYPING alice')
                 
                 # Send a message (should auto-stop typing)
                 client1.sendall(b'Hello world\n')
-                time.sleep(0.2)
-                
-                # Should receive typing-stop and the message
-                typing_stop_found = False
-                message_found = False
-                
-                for _ in range(3):  # Try multiple times to catch both messages
-                    try:
-                        response = client2.recv(1024).decode()
-                        if 'TYPING-STOP alice' in response:
-                            typing_stop_found = True
-                        if 'alice: Hello world' in response:
-                            message_found = True
-                    except socket.timeout:
-                        break
+                
+                # Should receive typing-stop and then the message
+                typing_stop_found = self._recv_from(sel, client2, b'TYPING-STOP alice', 1.0) is not None
+                message_found = self._recv_from(sel, client2, b'alice: Hello world', 1.0) is not None
                 
                 return typing_stop_found and message_found
                 
             except Exception as e:
                 print(f"Typing indicator test error: {e}")
                 return False
+            finally:
+                sel.close()
             
     def run_all_tests(self):
         """Run the complete test suite"""
@@ -606,43 +795,87 @@ class TempestTestSuite:
             return False
             
         try:
-            # Run all tests
-            tests = [
-                ("Basic Connection", self.test_basic_connection),
+            # Tests that only touch their own users and rooms run concurrently
+            parallel_tests = [
                 ("Version Display", self.test_version_display),
                 ("Room List on Connect", self.test_room_list_on_connect),
                 ("Help Command", self.test_help_command),
                 ("Room Operations", self.test_room_operations),
-                ("Multiple Clients", self.test_multiple_clients),
                 ("Python Client Connectivity", self.test_python_client_connectivity),
                 ("Large Payload Attack", self.test_large_payload_attack),
                 ("Nickname Injection", self.test_injection_in_nickname),
                 ("Room Name Injection", self.test_room_name_injection),
+                ("Malformed Commands", self.test_malformed_commands),
+                ("Unicode Injection", self.test_unicode_injection),
+                ("Duplicate Nickname", self.test_duplicate_nickname),
+                ("Re-connect Room Cleanup", self.test_reconnect_room_cleanup),
+                ("Command Word Boundary", self.test_command_word_boundary),
+            ]
+            # Tests with fixed nicknames, timing assumptions or server-wide
+            # limits (connections, rooms, rate limits) run one at a time
+            serial_tests = [
+                ("Multiple Clients", self.test_multiple_clients),
                 ("Message Flooding", self.test_message_flooding),
+                ("Rate Limit Refill", self.test_rate_limit_refill),
                 ("Connection Flooding", self.test_connection_flooding),
-                ("Malformed Commands", self.test_malformed_commands),
                 ("Resource Exhaustion (Rooms)", self.test_resource_exhaustion_rooms),
-                ("Unicode Injection", self.test_unicode_injection),
                 ("Typing Indicator", self.test_typing_indicator),
             ]
             
-            for test_name, test_func in tests:
-                self.run_test(test_name, test_func)
+            # Nothing else can pass if a client can't even connect
+            skipped = []
+            healthy = self.run_test("Basic Connection", self.test_basic_connection)
+            
+            # Parallel results arrive in completion order, so "in a row" means
+            # nothing there: three failures in total trip the breaker instead
+            if healthy:
+                parallel_failures = 0
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {executor.submit(self.run_test, test_name, test_func): test_name
+                               for test_name, test_func in parallel_tests}
+                    for future in concurrent.futures.as_completed(futures):
+                        if not future.result():
+                            parallel_failures += 1
+                        if parallel_failures >= 3:
+                            healthy = False
+                            # Tests already running finish; the rest never start
+                            skipped += [test_name for pending, test_name in futures.items()
+                                        if pending.cancel()]
+                            break
+            else:
+                skipped += [test_name for test_name, _ in parallel_tests]
+            
+            # Serial tests run in order, so three consecutive failures trip the breaker
+            consecutive_failures = 0
+            for test_name, test_func in serial_tests:
+                if not healthy or consecutive_failures >= 3:
+                    skipped.append(test_name)
+                    continue
+                consecutive_failures = 0 if self.run_test(test_name, test_func) else consecutive_failures + 1
+            
+            if skipped:
+                self.print_colored("Server unhealthy — aborting remaining tests", Colors.RED)
+                for test_name in skipped:
+                    self.print_colored(f"- {test_name} SKIPPED", Colors.YELLOW)
                 
         finally:
             self.stop_server()
 
-        total_tests = self.tests_passed + self.tests_failed
-        if self.tests_failed == 0:
+        total_tests = self.tests_passed + self.tests_failed + len(skipped)
+        if self.tests_failed == 0 and not skipped:
             self.print_colored("All tests passed!", Colors.YELLOW)
             return True
         else:
-            self.print_colored(f"❌ {self.tests_failed}/{total_tests} tests failed", Colors.RED)
+            summary = f"❌ {self.tests_failed}/{total_tests} tests failed"
+            if skipped:
+                summary += f", {len(skipped)} skipped"
+            self.print_colored(summary, Colors.RED)
             return False
 
 def main():
     """Main entry point"""
-    test_suite = TempestTestSuite()
+    # --reuse leaves the server running for the next --reuse run; --fresh restarts it
+    test_suite = TempestTestSuite(reuse='--reuse' in sys.argv, fresh='--fresh' in sys.argv)
     success = test_suite.run_all_tests()
     sys.exit(0 if success else 1)
 